@@ -27,6 +27,9 @@ from typing import Dict, List, Any, Optional, Tuple, Union
 
 from Core.DatabaseManager import DatabaseManager
 
+# Block size for reading files while calculating backup checksums
+HASH_BLOCK_SIZE = 1 << 20
+
 class BackupManager:
     """
     Manages project backups for the AIDEV-Deploy system.
@@ -99,6 +102,30 @@ class BackupManager:
         Returns:
             Dict[str, Any]: Backup information including ID and path
         """
+        return self.RegisterBackup(
+            self.PrepareBackup(ProjectPath, BackupType, UserId, Description, FilesToBackup)
+        )
+    
+    def PrepareBackup(self, ProjectPath: str, BackupType: str = None, 
+                   UserId: str = "admin", Description: str = None,
+                   FilesToBackup: List[str] = None) -> Dict[str, Any]:
+        """
+        Write a project backup to the backup location without recording it.
+        
+        This performs only filesystem work and does not touch the database, so
+        it can run on a worker thread. Pass the result to RegisterBackup to
+        record the backup, or to DiscardBackup to remove it.
+        
+        Args:
+            ProjectPath: Path to the project to back up
+            BackupType: Type of backup to create (FULL, PARTIAL, CONFIG)
+            UserId: ID of the user creating the backup
+            Description: Optional description of the backup
+            FilesToBackup: Optional list of specific files to back up
+            
+        Returns:
+            Dict[str, Any]: Prepared backup with ID, path, and metadata
+        """
         if not os.path.exists(ProjectPath):
             raise ValueError(f"Project path does not exist: {ProjectPath}")
         
@@ -188,26 +215,62 @@ class BackupManager:
             shutil.move(TempBackupDir, BackupDirPath)
             FinalBackupPath = BackupDirPath
         
-        # Store backup record in database
-        self._StoreBackupRecord(BackupId, Metadata, FinalBackupPath)
-        
         # Clean up temp directory if it still exists
         if os.path.exists(TempBackupDir):
             shutil.rmtree(TempBackupDir)
         
+        return {
+            "backup_id": BackupId,
+            "path": FinalBackupPath,
+            "metadata": Metadata
+        }
+    
+    def RegisterBackup(self, PreparedBackup: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Record a backup written by PrepareBackup in the database.
+        
+        Args:
+            PreparedBackup: Result of PrepareBackup
+            
+        Returns:
+            Dict[str, Any]: Backup information including ID and path
+        """
+        BackupId = PreparedBackup["backup_id"]
+        FinalBackupPath = PreparedBackup["path"]
+        Metadata = PreparedBackup["metadata"]
+        
+        # Store backup record in database
+        self._StoreBackupRecord(BackupId, Metadata, FinalBackupPath)
+        
         self.Logger.info(f"Backup created: {FinalBackupPath}")
         
         # Return backup information
         return {
             "backup_id": BackupId,
             "path": FinalBackupPath,
-            "timestamp": Timestamp.isoformat(),
-            "type": BackupType,
-            "size": Size,
-            "file_count": FileCount,
-            "checksum": Checksum
+            "timestamp": Metadata["timestamp"],
+            "type": Metadata["backup_type"],
+            "size": Metadata["size"],
+            "file_count": Metadata["file_count"],
+            "checksum": Metadata["checksum"]
         }
     
+    def DiscardBackup(self, PreparedBackup: Dict[str, Any]) -> None:
+        """
+        Remove a backup written by PrepareBackup that will not be recorded.
+        
+        Args:
+            PreparedBackup: Result of PrepareBackup
+        """
+        BackupPath = PreparedBackup["path"]
+        
+        if os.path.isdir(BackupPath):
+            shutil.rmtree(BackupPath)
+        elif os.path.exists(BackupPath):
+            os.remove(BackupPath)
+        
+        self.Logger.info(f"Discarded unrecorded backup: {BackupPath}")
+    
     def _GetFilesToBackup(self, ProjectPath: str, BackupType: str) -> List[str]:
         """
         Determine which files to back up based on backup type.
@@ -344,8 +407,8 @@ class BackupManager:
             Hasher.update(RelPath.encode())
             
             # Read and hash file content in chunks to handle large files
-            with open(FilePath, 'rb') as F:
-                for Chunk in iter(lambda: F.read(4096), b''):
+            with open(FilePath, 'rb', buffering=0) as F:
+                while Chunk := F.read(HASH_BLOCK_SIZE):
                     Hasher.update(Chunk)
         
         return Hasher.hexdigest()
@@ -382,8 +445,6 @@ class BackupManager:
                 )
             )
             
-            self.DatabaseManager.Connection.commit()
-            
         except Exception as E:
             self.Logger.error(f"Failed to store backup record: {E}")
             raise RuntimeError(f"Failed to store backup record: {E}")
@@ -445,7 +506,6 @@ class BackupManager:
                 "UPDATE backups SET verified = ? WHERE id = ?",
                 (True, BackupId)
             )
-            self.DatabaseManager.Connection.commit()
             
             self.Logger.info(f"Backup verified successfully: {BackupId}")
             return True
@@ -612,7 +672,6 @@ class BackupManager:
                 "DELETE FROM backups WHERE id = ?",
                 (BackupId,)
             )
-            self.DatabaseManager.Connection.commit()
             
             self.Logger.info(f"Deleted backup: {BackupId}")
             return True
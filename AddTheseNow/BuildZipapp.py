@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# File: BuildZipapp.py
+# Path: AIDEV-Deploy/Scripts/BuildZipapp.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-16
+# Last Modified: 2026-10-16
+# Description: Builds a precompiled zipapp of the AIDEV-Deploy CLI
+
+"""
+BuildZipapp Script
+
+This script packages Main.py and the Core, Utils and GUI packages into a
+single executable .pyz archive. Every module is compiled to bytecode first,
+so the archive can be imported without parsing any source on startup.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import compileall
+import zipapp
+import argparse
+from pathlib import Path
+
+# Project root, one level above the Scripts directory
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Top-level files and packages copied into the archive
+APP_CONTENTS = ["Main.py", "Core", "Utils", "GUI", "Models"]
+
+# Default archive name, written to the project root
+DEFAULT_OUTPUT = "aidev-deploy.pyz"
+
+# Interpreter line placed at the start of the archive
+DEFAULT_INTERPRETER = "/usr/bin/env python3"
+
+# Entry point written into the archive; zipapp's generated one would discard
+# Main()'s return value, so the archive would always exit 0
+MAIN_SOURCE = "import sys\nimport Main\n\nsys.exit(Main.Main())\n"
+
+def StageSources(StagingDir: Path, ProjectRoot: Path = PROJECT_ROOT) -> None:
+    """
+    Copy the application sources into a staging directory.
+    
+    Args:
+        StagingDir: Directory the archive will be built from
+        ProjectRoot: Root of the AIDEV-Deploy project
+    """
+    for Name in APP_CONTENTS:
+        Source = ProjectRoot / Name
+        if not Source.exists():
+            continue
+        
+        if Source.is_dir():
+            shutil.copytree(
+                Source, StagingDir / Name,
+                ignore=shutil.ignore_patterns("__pycache__", "*.pyc")
+            )
+        else:
+            shutil.copy2(Source, StagingDir / Name)
+
+def CompileSources(StagingDir: Path, Optimize: int = 2) -> bool:
+    """
+    Compile every module in the staging directory to bytecode.
+    
+    zipimport only loads bytecode that sits next to its source, so the
+    legacy layout is used instead of __pycache__ directories.
+    
+    Args:
+        StagingDir: Directory containing the staged sources
+        Optimize: Optimization level passed to the compiler
+    
+    Returns:
+        bool: True if every module compiled successfully
+    """
+    return bool(compileall.compile_dir(
+        str(StagingDir), quiet=1, legacy=True, optimize=Optimize
+    ))
+
+def BuildZipapp(OutputPath: Path, Interpreter: str = DEFAULT_INTERPRETER,
+                Optimize: int = 2) -> Path:
+    """
+    Build the precompiled zipapp archive.
+    
+    Args:
+        OutputPath: Path of the archive to create
+        Interpreter: Interpreter line for the archive
+        Optimize: Optimization level passed to the compiler
+    
+    Returns:
+        Path: Path of the created archive
+    """
+    with tempfile.TemporaryDirectory(prefix="aidev_zipapp_") as TempDir:
+        StagingDir = Path(TempDir) / "app"
+        StagingDir.mkdir()
+        
+        StageSources(StagingDir)
+        (StagingDir / "__main__.py").write_text(MAIN_SOURCE)
+        
+        if not CompileSources(StagingDir, Optimize):
+            raise RuntimeError("Failed to compile application sources")
+        
+        # Stored rather than deflated so modules load without decompression
+        zipapp.create_archive(
+            StagingDir, OutputPath, interpreter=Interpreter, compressed=False
+        )
+    
+    return OutputPath
+
+def Main():
+    """Command-line interface for building the zipapp."""
+    Parser = argparse.ArgumentParser(description="Build the AIDEV-Deploy zipapp")
+    Parser.add_argument("--output", default=str(PROJECT_ROOT / DEFAULT_OUTPUT),
+                     help="Archive path")
+    Parser.add_argument("--interpreter", default=DEFAULT_INTERPRETER,
+                     help="Interpreter line for the archive")
+    Parser.add_argument("--optimize", type=int, choices=[0, 1, 2], default=2,
+                     help="Bytecode optimization level")
+    
+    Args = Parser.parse_args()
+    
+    try:
+        OutputPath = BuildZipapp(Path(Args.output), Args.interpreter, Args.optimize)
+        print(f"Built {OutputPath} ({os.path.getsize(OutputPath)} bytes)")
+        return 0
+    except Exception as E:
+        print(f"Error: {E}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(Main())
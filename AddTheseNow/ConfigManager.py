@@ -14,7 +14,10 @@ YAML files with type checking and default values.
 """
 
 import os
+import copy
+import json
 import yaml
+import hashlib
 import logging
 import argparse
 from pathlib import Path
@@ -22,6 +25,21 @@ from typing import Dict, List, Any, Optional, Tuple, Union, Type, TypeVar, cast
 
 T = TypeVar('T')
 
+# Prefix for environment variable overrides
+ENV_VAR_PREFIX = "AIDEV_DEPLOY_"
+
+# Prefer the LibYAML-backed loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Bumped whenever the format of the parsed-configuration cache changes
+CONFIG_CACHE_VERSION = 2
+
+# Sentinels for configuration value lookups: a key not yet cached, and a
+# key cached as absent from the configuration
+_MISSING = object()
+_NOT_FOUND = object()
+
 class ConfigManager:
     """
     Manages configuration settings for the AIDEV-Deploy system.
@@ -37,17 +55,26 @@ class ConfigManager:
         TypeMap: Dictionary mapping configuration keys to expected types
     """
     
-    def __init__(self, ConfigPath: Optional[str] = None):
+    # Key holding the restricted directory list
+    RESTRICTED_DIRECTORIES_KEY = "security.restricted_directories"
+    
+    def __init__(self, ConfigPath: Optional[str] = None, UseCache: bool = True):
         """
         Initialize the ConfigManager.
         
         Args:
             ConfigPath: Path to the configuration file. If None, uses default location.
+            UseCache: Whether to reuse the parsed file from the per-user cache
+                directory when the configuration file is unchanged.
         """
         self.ConfigPath = ConfigPath or self._GetDefaultConfigPath()
+        self.UseCache = UseCache
         self.Config = {}
         self.DefaultConfig = self._CreateDefaultConfig()
         self.TypeMap = self._CreateTypeMap()
+        self._EnvVarNames = {Key: self._GetEnvVarName(Key) for Key in self.TypeMap}
+        self._RestrictedPrefixes: Optional[Tuple[str, ...]] = None
+        self._ValueCache: Dict[str, Any] = {}
         
         # Set up logging
         self.Logger = logging.getLogger("ConfigManager")
@@ -79,6 +106,7 @@ class ConfigManager:
                 "project_root": str(Path.home() / "projects"),
                 "debug_mode": False,
                 "log_level": "INFO",
+                "async_logging": False,
                 "theme": "system"
             },
             
@@ -96,6 +124,11 @@ class ConfigManager:
                 "auto_backup": True
             },
             
+            # Deployment Configuration
+            "deployment": {
+                "verify_after_copy": False
+            },
+            
             # Validation Configuration
             "validation": {
                 "standards": "AIDEV-PascalCase-1.6",
@@ -146,6 +179,7 @@ class ConfigManager:
             "general.project_root": str,
             "general.debug_mode": bool,
             "general.log_level": str,
+            "general.async_logging": bool,
             "general.theme": str,
             
             "database.path": str,
@@ -156,6 +190,8 @@ class ConfigManager:
             "backup.retention_count": int,
             "backup.auto_backup": bool,
             
+            "deployment.verify_after_copy": bool,
+            
             "validation.standards": str,
             "validation.strict_mode": bool,
             "validation.auto_validation": bool,
@@ -183,9 +219,14 @@ class ConfigManager:
         
         If the file doesn't exist, creates it with default values.
         Merges loaded configuration with defaults to ensure all required values exist.
+        Validation is skipped when the file is unchanged since it last validated
+        cleanly (tracked by a size/mtime stamp in a .vstamp sidecar file), and
+        parsing is skipped when the per-user cache holds the file parsed at that stamp.
         """
         # Start with default configuration
-        self.Config = self.DefaultConfig.copy()
+        self.Config = copy.deepcopy(self.DefaultConfig)
+        self._RestrictedPrefixes = None
+        self._ValueCache.clear()
         
         # Check if the config file exists
         if not os.path.exists(self.ConfigPath):
@@ -194,23 +235,32 @@ class ConfigManager:
             return
         
         try:
-            # Load configuration from file
-            with open(self.ConfigPath, 'r') as File:
-                LoadedConfig = yaml.safe_load(File)
+            Stamp = self._GetConfigStamp()
+            
+            # Reuse the parsed file if it is unchanged since it was cached
+            LoadedConfig = self._ReadConfigCache(Stamp)
+            if LoadedConfig is None:
+                # Load configuration from file (raw bytes; the loader decodes them)
+                with open(self.ConfigPath, 'rb') as File:
+                    LoadedConfig = yaml.load(File.read(), Loader=_YAML_LOADER)
+                self._WriteConfigCache(Stamp, LoadedConfig)
             
             if LoadedConfig:
                 # Merge loaded configuration with defaults
                 self._MergeConfig(self.Config, LoadedConfig)
             
-            # Validate configuration
-            self._ValidateConfig()
+            # Validate configuration unless this exact file already validated cleanly
+            if Stamp != self._ReadValidationStamp():
+                if self._ValidateConfig():
+                    self._WriteValidationStamp(Stamp)
             
             self.Logger.info(f"Loaded configuration from: {self.ConfigPath}")
             
         except Exception as E:
             self.Logger.error(f"Failed to load configuration: {E}")
             # Revert to defaults
-            self.Config = self.DefaultConfig.copy()
+            self.Config = copy.deepcopy(self.DefaultConfig)
+            self._ValueCache.clear()
     
     def SaveConfig(self) -> None:
         """
@@ -220,15 +270,169 @@ class ConfigManager:
             # Ensure the directory exists
             os.makedirs(os.path.dirname(self.ConfigPath), exist_ok=True)
             
+            # Invalidate the validation stamp and cache for the previous file contents
+            self._RemoveValidationStamp()
+            self._RemoveConfigCache()
+            
             # Save configuration to file
-            with open(self.ConfigPath, 'w') as File:
-                yaml.dump(self.Config, File, default_flow_style=False)
+            with open(self.ConfigPath, 'wb') as File:
+                yaml.dump(self.Config, File, Dumper=_YAML_DUMPER,
+                          default_flow_style=False, encoding='utf-8')
             
             self.Logger.info(f"Saved configuration to: {self.ConfigPath}")
             
         except Exception as E:
             self.Logger.error(f"Failed to save configuration: {E}")
     
+    def _GetValidationStampPath(self) -> str:
+        """
+        Get the path of the validation stamp sidecar file.
+        
+        Returns:
+            str: Validation stamp file path
+        """
+        return f"{self.ConfigPath}.vstamp"
+    
+    def _GetConfigStamp(self) -> str:
+        """
+        Build a stamp identifying the current contents of the configuration file.
+        
+        Returns:
+            str: Stamp in the form "<mtime_ns>:<size>"
+        """
+        Stat = os.stat(self.ConfigPath)
+        return f"{Stat.st_mtime_ns}:{Stat.st_size}"
+    
+    def _ReadValidationStamp(self) -> Optional[str]:
+        """
+        Read the stamp recorded after the last clean validation.
+        
+        Returns:
+            Optional[str]: Recorded stamp, or None if there is none
+        """
+        try:
+            with open(self._GetValidationStampPath(), 'r') as File:
+                return File.read().strip()
+        except OSError:
+            return None
+    
+    def _WriteValidationStamp(self, Stamp: str) -> None:
+        """
+        Record that the configuration file validated cleanly.
+        
+        Args:
+            Stamp: Stamp of the validated configuration file
+        """
+        try:
+            with open(self._GetValidationStampPath(), 'w') as File:
+                File.write(Stamp)
+        except OSError as E:
+            self.Logger.warning(f"Failed to write validation stamp: {E}")
+    
+    def _RemoveValidationStamp(self) -> None:
+        """
+        Remove the validation stamp so the next load validates again.
+        """
+        try:
+            os.remove(self._GetValidationStampPath())
+        except FileNotFoundError:
+            pass
+    
+    def _GetConfigCachePath(self) -> str:
+        """
+        Get the path of the parsed-configuration cache file.
+        
+        The cache lives in the user's own cache directory rather than next to
+        the configuration file, named after a hash of the configuration path.
+        
+        Returns:
+            str: Configuration cache file path
+        """
+        CacheDir = os.environ.get("XDG_CACHE_HOME") or os.path.join(str(Path.home()), ".cache")
+        PathHash = hashlib.sha1(os.path.abspath(self.ConfigPath).encode("utf-8")).hexdigest()
+        return os.path.join(CacheDir, "aidev-deploy", f"config-{PathHash}.json")
+    
+    def _GetConfigCacheKey(self, Stamp: str) -> List[Any]:
+        """
+        Build the key identifying a cached parse of the configuration file.
+        
+        Args:
+            Stamp: Stamp of the configuration file
+            
+        Returns:
+            List[Any]: Cache format version, file path, and stamp
+        """
+        return [CONFIG_CACHE_VERSION, os.path.abspath(self.ConfigPath), Stamp]
+    
+    def _ReadConfigCache(self, Stamp: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the parsed configuration file from the cache if it is current.
+        
+        Args:
+            Stamp: Stamp of the configuration file
+            
+        Returns:
+            Optional[Dict[str, Any]]: Parsed configuration, or None on a cache miss
+        """
+        if not self.UseCache:
+            return None
+        
+        try:
+            # JSON, so a tampered cache can at worst hold wrong values, never code
+            with open(self._GetConfigCachePath(), 'rb') as File:
+                Cached = json.load(File)
+            if Cached["key"] != self._GetConfigCacheKey(Stamp):
+                return None
+            return Cached["config"]
+        except Exception:
+            return None
+    
+    def _WriteConfigCache(self, Stamp: str, LoadedConfig: Any) -> None:
+        """
+        Cache the parsed configuration file for later loads.
+        
+        Files that JSON cannot represent exactly (such as YAML dates or
+        non-string keys) are not cached and are parsed on every load.
+        
+        Args:
+            Stamp: Stamp of the configuration file that was parsed
+            LoadedConfig: Parsed configuration file contents
+        """
+        if not self.UseCache:
+            return
+        
+        try:
+            Data = json.dumps({"key": self._GetConfigCacheKey(Stamp), "config": LoadedConfig})
+            if json.loads(Data)["config"] != LoadedConfig:
+                return
+        except (TypeError, ValueError):
+            return
+        
+        CachePath = self._GetConfigCachePath()
+        TempPath = f"{CachePath}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(CachePath), mode=0o700, exist_ok=True)
+            
+            # Write then rename so a concurrent load never reads a partial cache
+            with open(TempPath, 'w', encoding='utf-8') as File:
+                File.write(Data)
+            os.replace(TempPath, CachePath)
+        except Exception as E:
+            self.Logger.warning(f"Failed to write configuration cache: {E}")
+            try:
+                os.remove(TempPath)
+            except OSError:
+                pass
+    
+    def _RemoveConfigCache(self) -> None:
+        """
+        Remove the parsed-configuration cache so the next load parses the file.
+        """
+        try:
+            os.remove(self._GetConfigCachePath())
+        except FileNotFoundError:
+            pass
+    
     def _MergeConfig(self, Base: Dict[str, Any], Override: Dict[str, Any]) -> None:
         """
         Recursively merge configuration dictionaries.
@@ -246,17 +450,39 @@ class ConfigManager:
             else:
                 Base[Key] = Value
     
-    def _ValidateConfig(self) -> None:
+    def _ValidateConfig(self) -> bool:
         """
         Validate configuration types and values.
         
-        Raises:
-            ValueError: If a configuration value has an invalid type
+        Values with an invalid type are converted or reset to their defaults.
+        
+        Returns:
+            bool: True if every value already had the expected type
         """
+        AllValid = True
+        
+        # Collect environment overrides in one pass instead of one lookup per key
+        EnvOverrides = {
+            Name: Value for Name, Value in os.environ.items()
+            if Name.startswith(ENV_VAR_PREFIX)
+        }
+        
         for Key, ExpectedType in self.TypeMap.items():
-            Value = self.GetConfigValue(Key)
+            EnvValue = EnvOverrides.get(self._EnvVarNames[Key])
+            if EnvValue is not None:
+                try:
+                    # Overrides are converted on read; only check that this one can be
+                    ExpectedType(EnvValue)
+                except Exception:
+                    self.Logger.warning(f"Failed to convert environment variable {self._EnvVarNames[Key]}")
+            
+            # The file value is checked even when overridden, since a clean
+            # result is stamped and reused on later loads without the override
+            Value = self._GetFromConfigOnly(Key)
             
-            if Value is not None and not isinstance(Value, ExpectedType):
+            if Value is not None and not self._IsExpectedType(Value, ExpectedType):
+                AllValid = False
+                
                 # Try to convert the value to the expected type
                 try:
                     ConvertedValue = ExpectedType(Value)
@@ -271,6 +497,30 @@ class ConfigManager:
                     if DefaultValue is not None:
                         self.SetConfigValue(Key, DefaultValue)
                         self.Logger.warning(f"Reset {Key} to default value: {DefaultValue}")
+        
+        return AllValid
+    
+    def _IsExpectedType(self, Value: Any, ExpectedType: Type) -> bool:
+        """
+        Check whether a value matches the expected configuration type.
+        
+        Exact type matches (the common case for YAML scalars) are accepted
+        without an isinstance MRO walk. Booleans are rejected for int keys
+        even though bool is a subclass of int.
+        
+        Args:
+            Value: Value to check
+            ExpectedType: Expected type from the TypeMap
+            
+        Returns:
+            bool: True if the value has the expected type
+        """
+        ValueType = type(Value)
+        if ValueType is ExpectedType:
+            return True
+        if ExpectedType is int and ValueType is bool:
+            return False
+        return isinstance(Value, ExpectedType)
     
     def GetConfigValue(self, Key: str, DefaultValue: Any = None) -> Any:
         """
@@ -284,7 +534,7 @@ class ConfigManager:
             Any: Configuration value or default
         """
         # Check for environment variable override
-        EnvVarName = f"AIDEV_DEPLOY_{Key.upper().replace('.', '_')}"
+        EnvVarName = self._EnvVarNames.get(Key) or self._GetEnvVarName(Key)
         EnvValue = os.environ.get(EnvVarName)
         if EnvValue is not None:
             # Convert to appropriate type
@@ -296,16 +546,45 @@ class ConfigManager:
                     self.Logger.warning(f"Failed to convert environment variable {EnvVarName}")
         
         # Get from configuration
-        Config = self.Config
-        KeyParts = Key.split('.')
+        return self._GetFromConfigOnly(Key, DefaultValue)
+    
+    def _GetFromConfigOnly(self, Key: str, DefaultValue: Any = None) -> Any:
+        """
+        Get a configuration value by key, ignoring environment variable overrides.
         
-        for Part in KeyParts:
-            if isinstance(Config, dict) and Part in Config:
-                Config = Config[Part]
-            else:
-                return DefaultValue
+        Args:
+            Key: Configuration key (using dot notation)
+            DefaultValue: Default value if key doesn't exist
+            
+        Returns:
+            Any: Configuration value or default
+        """
+        # Keys are looked up repeatedly, so each path is only walked once
+        # until the configuration changes
+        Value = self._ValueCache.get(Key, _MISSING)
+        if Value is _MISSING:
+            Value = self.Config
+            for Part in Key.split('.'):
+                if isinstance(Value, dict) and Part in Value:
+                    Value = Value[Part]
+                else:
+                    Value = _NOT_FOUND
+                    break
+            self._ValueCache[Key] = Value
         
-        return Config
+        return DefaultValue if Value is _NOT_FOUND else Value
+    
+    def _GetEnvVarName(self, Key: str) -> str:
+        """
+        Get the name of the environment variable that overrides a key.
+        
+        Args:
+            Key: Configuration key (using dot notation)
+            
+        Returns:
+            str: Environment variable name
+        """
+        return f"{ENV_VAR_PREFIX}{Key.upper().replace('.', '_')}"
     
     def GetDefaultConfigValue(self, Key: str) -> Any:
         """
@@ -338,7 +617,7 @@ class ConfigManager:
         """
         # Validate the type
         ExpectedType = self.TypeMap.get(Key)
-        if ExpectedType and not isinstance(Value, ExpectedType):
+        if ExpectedType and not self._IsExpectedType(Value, ExpectedType):
             try:
                 Value = ExpectedType(Value)
             except Exception:
@@ -357,6 +636,32 @@ class ConfigManager:
             Config = Config[Part]
         
         Config[LastPart] = Value
+        
+        # Setting a key can replace or create values under other cached keys
+        self._ValueCache.clear()
+        
+        # Invalidate the compiled restricted-directory prefixes
+        if Key.startswith(self.RESTRICTED_DIRECTORIES_KEY) or self.RESTRICTED_DIRECTORIES_KEY.startswith(Key):
+            self._RestrictedPrefixes = None
+    
+    def GetRestrictedPrefixes(self) -> Tuple[str, ...]:
+        """
+        Get the restricted directories as a tuple of normalized path prefixes.
+        
+        The tuple is built once and cached so callers can test a path against
+        every restricted directory with a single str.startswith call. Each
+        prefix ends with a path separator, so callers should normalize the
+        path and append os.sep before checking.
+        
+        Returns:
+            Tuple[str, ...]: Restricted directory prefixes
+        """
+        if self._RestrictedPrefixes is None:
+            Directories = self.GetConfigValue(self.RESTRICTED_DIRECTORIES_KEY) or []
+            self._RestrictedPrefixes = tuple(
+                os.path.join(os.path.normpath(Directory), "") for Directory in Directories
+            )
+        return self._RestrictedPrefixes
     
     def GetSectionConfig(self, Section: str) -> Dict[str, Any]:
         """
@@ -374,7 +679,9 @@ class ConfigManager:
         """
         Reset configuration to default values.
         """
-        self.Config = self.DefaultConfig.copy()
+        self.Config = copy.deepcopy(self.DefaultConfig)
+        self._RestrictedPrefixes = None
+        self._ValueCache.clear()
         self.SaveConfig()
         self.Logger.info("Reset configuration to defaults")
     
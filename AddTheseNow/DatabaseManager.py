@@ -15,14 +15,31 @@ the underlying SQLite database.
 """
 
 import os
+import queue
+import hashlib
 import sqlite3
-import argparse
-import json
+import threading
 import datetime
 import uuid
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, Union
 
+# Schema version stored in the database's user_version once initialized;
+# bump this whenever InitializeDatabase changes
+SCHEMA_VERSION = 3
+
+# Seconds to wait for another connection's lock before raising "database is locked"
+BUSY_TIMEOUT = 5.0
+
+# Page cache size; negative values are in KiB (256 MiB, allocated as used)
+CACHE_SIZE = -262144
+
+# Maximum number of read-only connections kept for ExecuteRead* queries
+DEFAULT_READ_POOL_SIZE = 2 * (os.cpu_count() or 1)
+
+# Block size for checksums on Pythons without hashlib.file_digest
+CHECKSUM_BLOCK_SIZE = 1 << 20
+
 class DatabaseManager:
     """
     Manages database connections and operations for the AIDEV-Deploy system.
@@ -36,19 +53,26 @@ class DatabaseManager:
         Connection: Active SQLite connection
         Cursor: Database cursor for executing queries
         IsTransactionActive: Flag indicating if a transaction is in progress
+        ReadPoolSize: Maximum number of read-only connections
     """
     
-    def __init__(self, DatabasePath: str = None):
+    def __init__(self, DatabasePath: str = None, ReadPoolSize: int = DEFAULT_READ_POOL_SIZE):
         """
         Initialize the DatabaseManager.
         
         Args:
             DatabasePath: Path to the SQLite database file. If None, uses default location.
+            ReadPoolSize: Maximum number of read-only connections, opened as
+                needed, used by ExecuteReadFetchOne and ExecuteReadFetchAll
         """
         self.DatabasePath = DatabasePath or self._GetDefaultDatabasePath()
         self.Connection = None
         self.Cursor = None
         self.IsTransactionActive = False
+        self.ReadPoolSize = max(0, ReadPoolSize)
+        self._ReadPool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._ReadConnections: List[sqlite3.Connection] = []
+        self._ReadPoolLock = threading.Lock()
         
         # Ensure the database directory exists
         os.makedirs(os.path.dirname(self.DatabasePath), exist_ok=True)
@@ -71,14 +95,31 @@ class DatabaseManager:
         """
         Establish a connection to the SQLite database.
         """
-        self.Connection = sqlite3.connect(self.DatabasePath)
+        # Autocommit mode: single statements commit on their own, and statements
+        # that must commit together are grouped with BeginTransaction
+        self.Connection = sqlite3.connect(
+            self.DatabasePath, timeout=BUSY_TIMEOUT, isolation_level=None
+        )
         self.Connection.row_factory = sqlite3.Row
         self.Cursor = self.Connection.cursor()
+        
+        # Write-ahead logging lets each commit append to the log without an
+        # fsync (synchronous=NORMAL syncs at checkpoints), and lets readers
+        # run alongside a writer
+        self.Connection.execute("PRAGMA journal_mode=WAL")
+        self.Connection.execute("PRAGMA synchronous=NORMAL")
+        self.Connection.execute(f"PRAGMA cache_size={CACHE_SIZE}")
     
     def Close(self) -> None:
         """
         Close the database connection.
         """
+        with self._ReadPoolLock:
+            for ReadConnection in self._ReadConnections:
+                ReadConnection.close()
+            self._ReadConnections = []
+            self._ReadPool = queue.Queue()
+        
         if self.Connection:
             self.Connection.close()
             self.Connection = None
@@ -89,6 +130,19 @@ class DatabaseManager:
         Create the database schema if it doesn't exist.
         This method creates all required tables for the AIDEV-Deploy system.
         """
+        # Create the whole schema and its default rows with a single commit
+        self.BeginTransaction()
+        try:
+            self._CreateSchema()
+            self.CommitTransaction()
+        except Exception:
+            self.RollbackTransaction()
+            raise
+    
+    def _CreateSchema(self) -> None:
+        """
+        Create the tables, indexes and default rows, and record the schema version.
+        """
         # Transactions table
         self.Cursor.execute('''
         CREATE TABLE IF NOT EXISTS transactions (
@@ -113,10 +167,14 @@ class DatabaseManager:
             status TEXT NOT NULL,
             validation_status TEXT,
             checksum TEXT,
+            validation_json TEXT,
             FOREIGN KEY (transaction_id) REFERENCES transactions(id)
         )
         ''')
         
+        # Databases created before validation results were stored per file
+        self._AddColumnIfMissing("files", "validation_json", "TEXT")
+        
         # Operations table
         self.Cursor.execute('''
         CREATE TABLE IF NOT EXISTS operations (
@@ -195,14 +253,52 @@ class DatabaseManager:
         )
         ''')
         
-        # Commit the changes
-        self.Connection.commit()
+        # Indexes for the lookups made on every transaction; the operations
+        # index also serves lookups by transaction_id alone
+        self.Cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_files_tx ON files(transaction_id)"
+        )
+        self.Cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ops_tx_status_type "
+            "ON operations(transaction_id, status, operation_type)"
+        )
+        self.Cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_vr_file ON validation_results(file_id)"
+        )
+        
+        # Refresh the query planner's statistics for the new indexes
+        self.Connection.execute("ANALYZE")
         
         # Insert default user if not exists
         self._InsertDefaultUser()
         
         # Insert default validation rules
         self._InsertDefaultValidationRules()
+        
+        # Record the schema version so later runs can skip initialization
+        self.Connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+    
+    def _AddColumnIfMissing(self, Table: str, Column: str, Definition: str) -> None:
+        """
+        Add a column to an existing table if it does not have it yet.
+        
+        Args:
+            Table: Name of the table
+            Column: Name of the column
+            Definition: Column type and constraints
+        """
+        Columns = {Row["name"] for Row in self.Connection.execute(f"PRAGMA table_info({Table})")}
+        if Column not in Columns:
+            self.Cursor.execute(f"ALTER TABLE {Table} ADD COLUMN {Column} {Definition}")
+    
+    def IsSchemaCurrent(self) -> bool:
+        """
+        Check whether the database was initialized with the current schema.
+        
+        Returns:
+            bool: True if InitializeDatabase has already run for this schema version
+        """
+        return self.Connection.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
     
     def _InsertDefaultUser(self) -> None:
         """
@@ -225,8 +321,6 @@ class DatabaseManager:
                     "INSERT INTO permissions (user_id, permission_type) VALUES (?, ?)",
                     (DefaultUserId, Permission)
                 )
-            
-            self.Connection.commit()
     
     def _InsertDefaultValidationRules(self) -> None:
         """
@@ -243,15 +337,16 @@ class DatabaseManager:
             )
             
             # More validation rules can be added here
-            
-            self.Connection.commit()
     
     def BeginTransaction(self) -> None:
         """
         Begin a database transaction.
+        
+        The write lock is taken immediately, so a transaction never has to
+        upgrade from a read lock while another connection is writing.
         """
         if not self.IsTransactionActive:
-            self.Connection.execute("BEGIN TRANSACTION")
+            self.Connection.execute("BEGIN IMMEDIATE")
             self.IsTransactionActive = True
     
     def CommitTransaction(self) -> None:
@@ -283,6 +378,19 @@ class DatabaseManager:
         """
         return self.Cursor.execute(Query, Parameters)
     
+    def ExecuteMany(self, Query: str, ParameterRows: List[tuple]) -> sqlite3.Cursor:
+        """
+        Execute a SQL query once for each row of parameters.
+        
+        Args:
+            Query: SQL query string
+            ParameterRows: List of query parameter tuples
+            
+        Returns:
+            sqlite3.Cursor: Query cursor result
+        """
+        return self.Cursor.executemany(Query, ParameterRows)
+    
     def ExecuteQueryFetchAll(self, Query: str, Parameters: tuple = ()) -> List[Dict[str, Any]]:
         """
         Execute a SQL query and fetch all results as a list of dictionaries.
@@ -312,6 +420,133 @@ class DatabaseManager:
         Row = self.Cursor.fetchone()
         return dict(Row) if Row else None
     
+    def ExecuteReadFetchAll(self, Query: str, Parameters: tuple = ()) -> List[Dict[str, Any]]:
+        """
+        Execute a read-only SQL query on a pooled reader and fetch all results.
+        
+        With WAL, readers do not wait for the writer, and several threads can
+        query at once. The query sees the last committed state; while this
+        manager has a write transaction open it runs on the write connection
+        instead, so uncommitted changes stay visible.
+        
+        Args:
+            Query: SQL query string (SELECT only)
+            Parameters: Query parameters as a tuple
+            
+        Returns:
+            List[Dict[str, Any]]: Query results as a list of dictionaries
+        """
+        ReadConnection = self._AcquireReader()
+        if ReadConnection is None:
+            return self.ExecuteQueryFetchAll(Query, Parameters)
+        
+        try:
+            return [dict(row) for row in ReadConnection.execute(Query, Parameters).fetchall()]
+        finally:
+            self._ReadPool.put(ReadConnection)
+    
+    def ExecuteReadFetchOne(self, Query: str, Parameters: tuple = ()) -> Optional[Dict[str, Any]]:
+        """
+        Execute a read-only SQL query on a pooled reader and fetch one result.
+        
+        Args:
+            Query: SQL query string (SELECT only)
+            Parameters: Query parameters as a tuple
+            
+        Returns:
+            Optional[Dict[str, Any]]: Query result as a dictionary or None
+        """
+        ReadConnection = self._AcquireReader()
+        if ReadConnection is None:
+            return self.ExecuteQueryFetchOne(Query, Parameters)
+        
+        try:
+            Row = ReadConnection.execute(Query, Parameters).fetchone()
+            return dict(Row) if Row else None
+        finally:
+            self._ReadPool.put(ReadConnection)
+    
+    def ExecuteReadFetchTuples(self, Query: str, Parameters: tuple = ()) -> List[tuple]:
+        """
+        Execute a read-only SQL query on a pooled reader and fetch all results as tuples.
+        
+        Rows are returned as plain tuples in the order of the selected columns,
+        skipping the conversion to dictionaries. Select columns explicitly so
+        callers can unpack each row by position.
+        
+        Args:
+            Query: SQL query string (SELECT only)
+            Parameters: Query parameters as a tuple
+            
+        Returns:
+            List[tuple]: Query results as a list of tuples
+        """
+        ReadConnection = self._AcquireReader() or self.Connection
+        
+        try:
+            Cursor = ReadConnection.cursor()
+            Cursor.row_factory = None
+            return Cursor.execute(Query, Parameters).fetchall()
+        finally:
+            if ReadConnection is not self.Connection:
+                self._ReadPool.put(ReadConnection)
+    
+    def _AcquireReader(self) -> Optional[sqlite3.Connection]:
+        """
+        Take a read-only connection from the pool, opening one if allowed.
+        
+        Returns:
+            Optional[sqlite3.Connection]: A reader, or None if the query should
+                run on the write connection
+        """
+        # In-memory databases are private to their connection, and an open
+        # write transaction must see its own changes
+        if (self.ReadPoolSize == 0 or self.DatabasePath == ":memory:" or 
+                (self.Connection is not None and self.Connection.in_transaction)):
+            return None
+        
+        try:
+            return self._ReadPool.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._ReadPoolLock:
+            if len(self._ReadConnections) < self.ReadPoolSize:
+                ReadConnection = sqlite3.connect(
+                    self.DatabasePath, timeout=BUSY_TIMEOUT, check_same_thread=False
+                )
+                ReadConnection.row_factory = sqlite3.Row
+                ReadConnection.execute("PRAGMA query_only=ON")
+                self._ReadConnections.append(ReadConnection)
+                return ReadConnection
+        
+        return self._ReadPool.get()
+    
+    def ComputeChecksum(self, FilePath: str) -> Optional[str]:
+        """
+        Calculate the SHA-256 checksum of a file.
+        
+        On Python 3.11+ hashlib.file_digest hashes the file in C through one
+        reusable buffer, using OpenSSL's SHA extensions where the CPU has them.
+        
+        Args:
+            FilePath: Path to the file
+            
+        Returns:
+            Optional[str]: Hex digest, or None if the file does not exist
+        """
+        try:
+            with open(FilePath, 'rb', buffering=0) as F:
+                if hasattr(hashlib, "file_digest"):
+                    return hashlib.file_digest(F, "sha256").hexdigest()
+                
+                Hasher = hashlib.sha256()
+                while Chunk := F.read(CHECKSUM_BLOCK_SIZE):
+                    Hasher.update(Chunk)
+                return Hasher.hexdigest()
+        except FileNotFoundError:
+            return None
+    
     def CreateBackup(self, BackupPath: str = None) -> str:
         """
         Create a backup of the database.
@@ -337,6 +572,8 @@ def Main():
     """
     Command-line interface for database initialization and management.
     """
+    import argparse
+    
     Parser = argparse.ArgumentParser(description="AIDEV-Deploy Database Manager")
     Parser.add_argument("--init", action="store_true", help="Initialize the database schema")
     Parser.add_argument("--backup", action="store_true", help="Create a database backup")
@@ -14,19 +14,57 @@ It coordinates with TransactionManager and BackupManager to ensure safe deployme
 """
 
 import os
+import sys
+import mmap
 import shutil
 import hashlib
 import tempfile
+import uuid
 import logging
 import datetime
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple, Union, Callable
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable, BinaryIO, Iterator
+
+# Optional fast non-cryptographic hash backends
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
 from Core.DatabaseManager import DatabaseManager
-from Core.TransactionManager import TransactionManager
+from Core.TransactionManager import TransactionManager, TRANSACTION_STATES
 from Core.BackupManager import BackupManager
 from Core.ValidationEngine import ValidationEngine
 
+# Block size used when streaming file contents
+COPY_BLOCK_SIZE = 1 << 20
+
+# Default number of files hashed or deployed concurrently
+DEFAULT_MAX_WORKERS = 8
+
+# Files at least this large are memory-mapped for hashing
+MMAP_HASH_THRESHOLD = 64 << 20
+
+# Files at least this large are tree-hashed in MERKLE_CHUNK_SIZE chunks in parallel
+MERKLE_HASH_THRESHOLD = 512 << 20
+MERKLE_CHUNK_SIZE = 64 << 20
+
+# Largest byte count requested from a single kernel copy call
+KERNEL_COPY_CHUNK_SIZE = 1 << 30
+
+# Default checksum algorithm (any hashlib algorithm, "blake3", or "xxh3_128")
+DEFAULT_HASH_ALGORITHM = "sha256"
+
+# Number of validation results kept in memory, most recently used first
+VALIDATION_CACHE_SIZE = 1024
+
 class DeploymentEngine:
     """
     Manages file deployment operations for the AIDEV-Deploy system.
@@ -43,6 +81,9 @@ class DeploymentEngine:
         ValidationEngine: Instance of ValidationEngine for file validation
         AutoBackup: Whether to automatically create backups before deployment
         BackupType: Type of backup to create before deployment
+        MaxWorkers: Maximum number of files hashed or deployed concurrently
+        HashAlgorithm: Algorithm used for file checksums
+        VerifyAfterCopy: Whether to re-hash copies the kernel made on the same filesystem
     """
     
     def __init__(self, DbManager: Optional[DatabaseManager] = None,
@@ -50,7 +91,10 @@ class DeploymentEngine:
                BackupMgr: Optional[BackupManager] = None,
                ValidEngine: Optional[ValidationEngine] = None,
                AutoBackup: bool = True,
-               BackupType: str = "FULL"):
+               BackupType: str = "FULL",
+               MaxWorkers: int = DEFAULT_MAX_WORKERS,
+               HashAlgorithm: str = DEFAULT_HASH_ALGORITHM,
+               VerifyAfterCopy: bool = False):
         """
         Initialize the DeploymentEngine.
         
@@ -61,6 +105,14 @@ class DeploymentEngine:
             ValidEngine: Optional ValidationEngine instance. If None, creates a new instance.
             AutoBackup: Whether to automatically create backups before deployment.
             BackupType: Type of backup to create before deployment.
+            MaxWorkers: Maximum number of files hashed or deployed concurrently.
+            HashAlgorithm: Algorithm used for file checksums. The checksums only
+                verify copies, so a fast non-cryptographic hash ("blake3" or
+                "xxh3_128", if installed) can be used instead of SHA-256.
+            VerifyAfterCopy: Whether to re-hash a destination written by
+                copy_file_range on the same filesystem as its source. Such
+                copies may share the source's blocks, so this is off by
+                default; other copies are always verified.
         """
         self.DatabaseManager = DbManager or DatabaseManager()
         self.TransactionManager = TransManager or TransactionManager(self.DatabaseManager)
@@ -68,13 +120,35 @@ class DeploymentEngine:
         self.ValidationEngine = ValidEngine or ValidationEngine()
         self.AutoBackup = AutoBackup
         self.BackupType = BackupType
+        self.MaxWorkers = max(1, MaxWorkers)
+        self.HashAlgorithm = HashAlgorithm
+        self.VerifyAfterCopy = VerifyAfterCopy
+        
+        # Fail early on an unknown or unavailable hash algorithm
+        self._CreateHasher()
+        
+        # Source checksums computed for the current deployment, keyed by
+        # (path, mtime_ns, size) so a modified source is never matched
+        self._SourceChecksums: Dict[Tuple[str, int, int], str] = {}
+        
+        # Pool for hashing a source while its copy is hashed on the calling thread
+        self._HashExecutor = ThreadPoolExecutor(
+            max_workers=self.MaxWorkers, thread_name_prefix="DeploymentHash"
+        )
+        
+        # Source stats taken once at the start of the current deployment
+        self._SourceStats: Dict[str, os.stat_result] = {}
+        
+        # Validation results for the current deployment or validation, keyed
+        # the same way plus the standard version validated against
+        self._ValidationCache: "OrderedDict[Tuple[str, int, int, str], Dict[str, Any]]" = OrderedDict()
         
         # Set up logging
         self.Logger = logging.getLogger("DeploymentEngine")
     
     def DeployFiles(self, SourceFiles: List[str], DestinationFiles: List[str], 
                   ProjectPath: str, UserId: str = "admin", 
-                  Description: str = None) -> Dict[str, Any]:
+                  Description: str = None, MaxWorkers: int = None) -> Dict[str, Any]:
         """
         Deploy a list of files to their destinations within a single transaction.
         
@@ -84,62 +158,145 @@ class DeploymentEngine:
             ProjectPath: Root path of the project
             UserId: ID of the user performing the deployment
             Description: Optional description of the deployment
+            MaxWorkers: Files hashed or deployed concurrently. If None, uses self.MaxWorkers.
             
         Returns:
             Dict[str, Any]: Deployment results including transaction ID and status
         """
+        Result = None
+        for Event in self.DeployFilesStreaming(
+            SourceFiles, DestinationFiles, ProjectPath, UserId, Description, MaxWorkers
+        ):
+            if Event["type"] == "result":
+                Result = Event["result"]
+        
+        return Result
+    
+    def DeployFilesStreaming(self, SourceFiles: List[str], DestinationFiles: List[str], 
+                           ProjectPath: str, UserId: str = "admin", 
+                           Description: str = None, 
+                           MaxWorkers: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        Deploy files like DeployFiles, yielding progress events as they happen.
+        
+        Events are dictionaries with a "type" key:
+            "transaction": the transaction was created ("transaction_id")
+            "validation": a file was validated ("file_id", "path", "status",
+                "errors", "warnings")
+            "result": the deployment finished ("result" holds what DeployFiles returns)
+        
+        Args:
+            SourceFiles: List of source file paths
+            DestinationFiles: List of destination file paths
+            ProjectPath: Root path of the project
+            UserId: ID of the user performing the deployment
+            Description: Optional description of the deployment
+            MaxWorkers: Files hashed or deployed concurrently. If None, uses self.MaxWorkers.
+            
+        Yields:
+            Dict[str, Any]: Deployment events, ending with a "result" event
+        """
         if len(SourceFiles) != len(DestinationFiles):
             raise ValueError("Source and destination file lists must have the same length")
         
+        Workers = max(1, MaxWorkers or self.MaxWorkers)
+        
         # Create a new transaction
         TransactionId = self.TransactionManager.CreateTransaction(UserId, ProjectPath, Description)
         self.Logger.info(f"Created transaction {TransactionId} for deployment")
         
+        self._SourceChecksums.clear()
+        self._ValidationCache.clear()
+        self._SourceStats = self._StatSourceFiles(SourceFiles)
+        
         try:
+            yield {"type": "transaction", "transaction_id": TransactionId}
+            
+            # Calculate checksums for later verification
+            Checksums = self._CalculateSourceChecksums(SourceFiles, Workers)
+            
             # Add files to transaction
-            for SourcePath, DestPath in zip(SourceFiles, DestinationFiles):
-                # Calculate checksum for later verification
-                Checksum = self._CalculateFileChecksum(SourcePath)
-                
-                # Add file to transaction
-                FileId = self.TransactionManager.AddFileToTransaction(
-                    TransactionId, SourcePath, DestPath, Checksum
-                )
-                self.Logger.info(f"Added file to transaction: {SourcePath} -> {DestPath}")
+            self.TransactionManager.AddFilesToTransaction(
+                TransactionId, list(zip(SourceFiles, DestinationFiles, Checksums))
+            )
+            self.Logger.debug("Added %d files to transaction %s", len(SourceFiles), TransactionId)
             
-            # Validate all files in the transaction
-            ValidationResults = self.ValidateFiles(TransactionId)
-            if not ValidationResults["all_valid"]:
-                self.Logger.warning(f"Validation failed for some files in transaction {TransactionId}")
-                self.TransactionManager.CloseTransaction(TransactionId)
-                return {
-                    "transaction_id": TransactionId,
-                    "status": "VALIDATION_FAILED",
-                    "validation_results": ValidationResults
+            # Write the backup on a worker thread while validation runs; only
+            # the database record is made here, since the connection is
+            # bound to this thread
+            with ThreadPoolExecutor(max_workers=1) as Executor:
+                BackupFuture = None
+                if self.AutoBackup:
+                    BackupFuture = Executor.submit(
+                        self.BackupManager.PrepareBackup,
+                        ProjectPath, self.BackupType, UserId, 
+                        f"Pre-deployment backup for transaction {TransactionId}"
+                    )
+                
+                # Validate all files in the transaction, reporting each as it finishes
+                ValidationResults = {
+                    "all_valid": True,
+                    "files": {}
                 }
+                try:
+                    for FileId, FileResult in self.IterValidateFiles(TransactionId):
+                        ValidationResults["files"][FileId] = FileResult
+                        if FileResult["status"] == "FAIL":
+                            ValidationResults["all_valid"] = False
+                        yield {"type": "validation", "file_id": FileId, **FileResult}
+                except BaseException:
+                    # Includes GeneratorExit, raised here when the consumer stops early
+                    self._DiscardPreparedBackup(BackupFuture)
+                    raise
+                
+                Result = None
+                BackupId = None
+                if not ValidationResults["all_valid"]:
+                    self.Logger.warning(f"Validation failed for some files in transaction {TransactionId}")
+                    self._DiscardPreparedBackup(BackupFuture)
+                    self.TransactionManager.CloseTransaction(TransactionId)
+                    Result = {
+                        "transaction_id": TransactionId,
+                        "status": "VALIDATION_FAILED",
+                        "validation_results": ValidationResults
+                    }
+                elif BackupFuture is not None:
+                    # Record the backup, removing its files if it cannot be recorded
+                    PreparedBackup = BackupFuture.result()
+                    try:
+                        BackupResult = self.BackupManager.RegisterBackup(PreparedBackup)
+                    except Exception:
+                        try:
+                            self.BackupManager.DiscardBackup(PreparedBackup)
+                        except Exception as E:
+                            self.Logger.warning(f"Failed to discard prepared backup: {E}")
+                        raise
+                    BackupId = BackupResult["backup_id"]
+                    self.Logger.info(f"Created backup {BackupId} before deployment")
             
-            # Create backup if enabled
-            BackupId = None
-            if self.AutoBackup:
-                BackupResult = self.BackupManager.CreateBackup(
-                    ProjectPath, self.BackupType, UserId, 
-                    f"Pre-deployment backup for transaction {TransactionId}"
+            if Result is None:
+                # Execute the transaction (deploy files)
+                self.TransactionManager.ExecuteTransaction(
+                    TransactionId, BackupId, self._DeployFile, Workers
                 )
-                BackupId = BackupResult["backup_id"]
-                self.Logger.info(f"Created backup {BackupId} before deployment")
-            
-            # Execute the transaction (deploy files)
-            self.TransactionManager.ExecuteTransaction(
-                TransactionId, BackupId, self._DeployFile
+                
+                self.Logger.info(f"Successfully executed transaction {TransactionId}")
+                Result = {
+                    "transaction_id": TransactionId,
+                    "status": "COMPLETED",
+                    "backup_id": BackupId
+                }
+        
+        except GeneratorExit:
+            # The consumer stopped before validation finished, so the
+            # deployment will never run
+            self.Logger.warning(f"Deployment for transaction {TransactionId} was abandoned")
+            self.TransactionManager.UpdateTransactionStatus(
+                TransactionId, TRANSACTION_STATES["FAILED"]
             )
-            
-            self.Logger.info(f"Successfully executed transaction {TransactionId}")
-            return {
-                "transaction_id": TransactionId,
-                "status": "COMPLETED",
-                "backup_id": BackupId
-            }
-            
+            self.TransactionManager.CloseTransaction(TransactionId)
+            raise
+        
         except Exception as E:
             # Transaction failure
             self.Logger.error(f"Transaction {TransactionId} failed: {E}")
@@ -150,11 +307,32 @@ class DeploymentEngine:
             except:
                 pass
             
-            return {
+            Result = {
                 "transaction_id": TransactionId,
                 "status": "FAILED",
                 "error": str(E)
             }
+        
+        finally:
+            # Source stats are only trusted for the length of the deployment
+            self._SourceStats = {}
+        
+        yield {"type": "result", "result": Result}
+    
+    def _DiscardPreparedBackup(self, BackupFuture) -> None:
+        """
+        Remove a backup that was prepared for a deployment that will not run.
+        
+        Args:
+            BackupFuture: Future returned for BackupManager.PrepareBackup, or None
+        """
+        if BackupFuture is None or BackupFuture.cancel():
+            return
+        
+        try:
+            self.BackupManager.DiscardBackup(BackupFuture.result())
+        except Exception as E:
+            self.Logger.warning(f"Failed to discard prepared backup: {E}")
     
     def ValidateFiles(self, TransactionId: str) -> Dict[str, Any]:
         """
@@ -166,8 +344,8 @@ class DeploymentEngine:
         Returns:
             Dict[str, Any]: Validation results
         """
-        # Get files in transaction
-        Files = self.TransactionManager.GetTransactionFiles(TransactionId)
+        # Results are only reused within one validation run
+        self._ValidationCache.clear()
         
         AllValid = True
         Results = {
@@ -175,34 +353,78 @@ class DeploymentEngine:
             "files": {}
         }
         
+        for FileId, FileResult in self.IterValidateFiles(TransactionId):
+            # Update overall validation status
+            if FileResult["status"] == "FAIL":
+                AllValid = False
+            
+            # Store results for this file
+            Results["files"][FileId] = FileResult
+        
+        Results["all_valid"] = AllValid
+        
+        return Results
+    
+    def IterValidateFiles(self, TransactionId: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Validate the files in a transaction one at a time.
+        
+        The transaction's stored validation status is updated after the last
+        file has been yielded, so the iterator should be consumed fully.
+        
+        Args:
+            TransactionId: ID of the transaction
+            
+        Yields:
+            Tuple[str, Dict[str, Any]]: File ID and that file's validation result
+        """
+        # Get files in transaction
+        Files = self.TransactionManager.GetTransactionFiles(TransactionId)
+        
         for File in Files:
-            FileId = File["id"]
             SourcePath = File["source_path"]
             
             # Validate the file
-            ValidationResult = self.ValidationEngine.ValidateFile(SourcePath)
-            Status = ValidationResult["status"]
-            
-            # Update overall validation status
-            if Status == "FAIL":
-                AllValid = False
+            ValidationResult = self._CachedValidate(SourcePath)
             
-            # Store results for this file
-            Results["files"][FileId] = {
+            yield File["id"], {
                 "path": SourcePath,
-                "status": Status,
+                "status": ValidationResult["status"],
                 "errors": ValidationResult.get("errors", []),
                 "warnings": ValidationResult.get("warnings", [])
             }
         
-        Results["all_valid"] = AllValid
-        
         # Update transaction validation status
         self.TransactionManager.ValidateTransaction(
-            TransactionId, lambda path: self.ValidationEngine.ValidateFile(path)
+            TransactionId, self._CachedValidate
         )
+    
+    def _CachedValidate(self, SourcePath: str) -> Dict[str, Any]:
+        """
+        Validate a source file, reusing a result computed earlier in the deployment.
         
-        return Results
+        Args:
+            SourcePath: Path to the source file
+            
+        Returns:
+            Dict[str, Any]: Validation result from the ValidationEngine
+        """
+        Stat = self._GetSourceStat(SourcePath)
+        if Stat is None:
+            return self.ValidationEngine.ValidateFile(SourcePath)
+        
+        CacheKey = (SourcePath, Stat.st_mtime_ns, Stat.st_size, self.ValidationEngine.StandardVersion)
+        ValidationResult = self._ValidationCache.get(CacheKey)
+        
+        if ValidationResult is None:
+            ValidationResult = self.ValidationEngine.ValidateFile(SourcePath)
+            self._ValidationCache[CacheKey] = ValidationResult
+            if len(self._ValidationCache) > VALIDATION_CACHE_SIZE:
+                self._ValidationCache.popitem(last=False)
+        else:
+            self._ValidationCache.move_to_end(CacheKey)
+        
+        return ValidationResult
     
     def _DeployFile(self, SourcePath: str, DestinationPath: str) -> bool:
         """
@@ -227,23 +449,268 @@ class DeploymentEngine:
             if os.path.exists(DestinationPath):
                 self._ArchiveExistingFile(DestinationPath)
             
-            # Copy the file
-            shutil.copy2(SourcePath, DestinationPath)
-            
-            # Verify the copy
-            SourceChecksum = self._CalculateFileChecksum(SourcePath)
-            DestChecksum = self._CalculateFileChecksum(DestinationPath)
-            
-            if SourceChecksum != DestChecksum:
-                raise ValueError(f"Checksum mismatch after deployment: {DestinationPath}")
+            # Write to a temporary file beside the destination, so the finished
+            # copy can be swapped in with an atomic rename
+            TempPath = f"{DestinationPath}.tmp.{uuid.uuid4().hex}"
+            try:
+                VerifyCopy = True
+                
+                # Stat afresh so a source changed since it was hashed misses the cache
+                SourceStat = os.stat(SourcePath)
+                SourceChecksum = self._GetSourceChecksum(
+                    SourcePath, ComputeIfMissing=False, Stat=SourceStat
+                )
+                SourceFuture = None
+                if SourceChecksum is None and SourceStat.st_size < MERKLE_HASH_THRESHOLD:
+                    # Copy the file, hashing the source bytes as they are copied
+                    SourceChecksum = self._CopyFileWithChecksum(SourcePath, TempPath)
+                else:
+                    CopyMethod = self._CopyFile(SourcePath, TempPath)
+                    
+                    if SourceChecksum is None:
+                        # Large files are tree-hashed, which a streaming copy cannot
+                        # produce; hash the source while the copy is hashed below
+                        SourceFuture = self._HashExecutor.submit(
+                            self._CalculateFileChecksum, SourcePath
+                        )
+                    else:
+                        VerifyCopy = self.VerifyAfterCopy or not self._IsSameFilesystemCopy(
+                            CopyMethod, SourceStat, TempPath
+                        )
+                
+                # Verify the copy
+                if VerifyCopy:
+                    DestChecksum = self._CalculateFileChecksum(TempPath)
+                    if SourceFuture is not None:
+                        SourceChecksum = SourceFuture.result()
+                    
+                    if SourceChecksum != DestChecksum:
+                        raise ValueError(f"Checksum mismatch after deployment: {DestinationPath}")
+                
+                os.replace(TempPath, DestinationPath)
+            except Exception:
+                if os.path.exists(TempPath):
+                    os.remove(TempPath)
+                raise
             
-            self.Logger.info(f"Deployed file: {SourcePath} -> {DestinationPath}")
+            self.Logger.debug("Deployed file: %s -> %s", SourcePath, DestinationPath)
             return True
             
         except Exception as E:
             self.Logger.error(f"Failed to deploy file {SourcePath} to {DestinationPath}: {E}")
             return False
     
+    def _GetSourceChecksum(self, SourcePath: str, ComputeIfMissing: bool = True,
+                         Stat: Optional[os.stat_result] = None) -> Optional[str]:
+        """
+        Get the checksum of a source file, reusing one computed earlier in the deployment.
+        
+        Cached checksums are keyed by path, modification time, and size, so a
+        source file that changes after it was hashed is treated as a cache miss.
+        
+        Args:
+            SourcePath: Path to the source file
+            ComputeIfMissing: Whether to calculate and cache the checksum on a miss
+            Stat: Current stat of the source file. If None, uses the deployment's stat.
+            
+        Returns:
+            Optional[str]: Checksum hash, or None if unavailable
+        """
+        Stat = Stat or self._GetSourceStat(SourcePath)
+        if Stat is None:
+            return None
+        
+        CacheKey = (SourcePath, Stat.st_mtime_ns, Stat.st_size)
+        Checksum = self._SourceChecksums.get(CacheKey)
+        
+        if Checksum is None and ComputeIfMissing:
+            Checksum = self._CalculateFileChecksum(SourcePath)
+            if Checksum is not None:
+                self._SourceChecksums[CacheKey] = Checksum
+        
+        return Checksum
+    
+    def _StatSourceFiles(self, SourceFiles: List[str]) -> Dict[str, os.stat_result]:
+        """
+        Stat each source file once for reuse by hashing and validation.
+        
+        Args:
+            SourceFiles: List of source file paths
+            
+        Returns:
+            Dict[str, os.stat_result]: Stats of the source files that exist
+        """
+        Stats = {}
+        for SourcePath in SourceFiles:
+            try:
+                Stats[SourcePath] = os.stat(SourcePath)
+            except OSError:
+                pass
+        
+        return Stats
+    
+    def _GetSourceStat(self, SourcePath: str) -> Optional[os.stat_result]:
+        """
+        Get the stat of a source file taken at the start of the deployment.
+        
+        Args:
+            SourcePath: Path to the source file
+            
+        Returns:
+            Optional[os.stat_result]: File stat, or None if the file does not exist
+        """
+        Stat = self._SourceStats.get(SourcePath)
+        if Stat is not None:
+            return Stat
+        
+        try:
+            return os.stat(SourcePath)
+        except OSError:
+            return None
+    
+    def _CalculateSourceChecksums(self, SourceFiles: List[str], 
+                                MaxWorkers: int = None) -> List[Optional[str]]:
+        """
+        Calculate checksums for several source files concurrently.
+        
+        Hashing is I/O bound and hashlib releases the GIL on large buffers,
+        so files are hashed on a thread pool.
+        
+        Args:
+            SourceFiles: List of source file paths
+            MaxWorkers: Maximum number of files hashed at once. If None, uses self.MaxWorkers.
+            
+        Returns:
+            List[Optional[str]]: Checksums in the same order as SourceFiles
+        """
+        Workers = min(MaxWorkers or self.MaxWorkers, len(SourceFiles))
+        if Workers <= 1:
+            return [self._GetSourceChecksum(SourcePath) for SourcePath in SourceFiles]
+        
+        with ThreadPoolExecutor(max_workers=Workers) as Executor:
+            return list(Executor.map(self._GetSourceChecksum, SourceFiles))
+    
+    def _CopyFileWithChecksum(self, SourcePath: str, DestinationPath: str) -> str:
+        """
+        Copy a file and calculate the checksum of the copied bytes in one pass.
+        
+        Args:
+            SourcePath: Path to the source file
+            DestinationPath: Path where the copy should be written
+            
+        Returns:
+            str: Checksum hash of the source content
+        """
+        Hasher = self._CreateHasher()
+        
+        # The source is read unbuffered; the destination stays buffered so
+        # writes are always complete
+        with open(SourcePath, 'rb', buffering=0) as Source, open(DestinationPath, 'wb') as Destination:
+            while Chunk := Source.read(COPY_BLOCK_SIZE):
+                Hasher.update(Chunk)
+                Destination.write(Chunk)
+            
+            Destination.flush()
+            os.fsync(Destination.fileno())
+        
+        # Preserve metadata the way shutil.copy2 does
+        shutil.copystat(SourcePath, DestinationPath)
+        
+        return Hasher.hexdigest()
+    
+    def _CopyFile(self, SourcePath: str, DestinationPath: str) -> str:
+        """
+        Copy a file and its metadata, letting the kernel move the data when possible.
+        
+        Tries os.copy_file_range first (which can reflink on copy-on-write
+        filesystems), then os.sendfile, then a userspace block copy.
+        
+        Args:
+            SourcePath: Path to the source file
+            DestinationPath: Path where the copy should be written
+            
+        Returns:
+            str: Name of the copy method that was used
+        """
+        with open(SourcePath, 'rb') as Source, open(DestinationPath, 'wb') as Destination:
+            SourceFd = Source.fileno()
+            DestFd = Destination.fileno()
+            Size = os.fstat(SourceFd).st_size
+            
+            KernelCopies = []
+            if hasattr(os, "copy_file_range"):
+                KernelCopies.append((
+                    "copy_file_range",
+                    lambda Offset, Count: os.copy_file_range(SourceFd, DestFd, Count, Offset, Offset)
+                ))
+            if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+                KernelCopies.append((
+                    "sendfile",
+                    lambda Offset, Count: os.sendfile(DestFd, SourceFd, Offset, Count)
+                ))
+            
+            for Method, CopyChunk in KernelCopies:
+                if self._KernelCopy(CopyChunk, Size):
+                    break
+            else:
+                Method = "copyfileobj"
+                shutil.copyfileobj(Source, Destination, COPY_BLOCK_SIZE)
+            
+            Destination.flush()
+            os.fsync(DestFd)
+        
+        # Preserve metadata the way shutil.copy2 does
+        shutil.copystat(SourcePath, DestinationPath)
+        
+        return Method
+    
+    def _IsSameFilesystemCopy(self, CopyMethod: str, SourceStat: os.stat_result, 
+                            DestinationPath: str) -> bool:
+        """
+        Check whether a copy was made by copy_file_range within one filesystem.
+        
+        Args:
+            CopyMethod: Copy method returned by _CopyFile
+            SourceStat: Stat of the source file
+            DestinationPath: Path to the copy
+            
+        Returns:
+            bool: True if the whole file was copied by copy_file_range on the same device
+        """
+        if CopyMethod != "copy_file_range":
+            return False
+        
+        DestStat = os.stat(DestinationPath)
+        return SourceStat.st_dev == DestStat.st_dev and SourceStat.st_size == DestStat.st_size
+    
+    def _KernelCopy(self, CopyChunk: Callable[[int, int], int], Size: int) -> bool:
+        """
+        Copy file data with a kernel copy call, looping until all bytes are moved.
+        
+        Args:
+            CopyChunk: Function taking (offset, count) and returning bytes copied
+            Size: Number of bytes to copy
+            
+        Returns:
+            bool: True if the data was copied, False if the method is unsupported
+        """
+        Offset = 0
+        while Offset < Size:
+            try:
+                Copied = CopyChunk(Offset, min(Size - Offset, KERNEL_COPY_CHUNK_SIZE))
+            except OSError:
+                # Unsupported here (e.g. cross-device or filesystem limits); nothing written yet
+                if Offset == 0:
+                    return False
+                raise
+            
+            if Copied == 0:
+                break
+            
+            Offset += Copied
+        
+        return True
+    
     def _ArchiveExistingFile(self, FilePath: str) -> str:
         """
         Archive an existing file before it is replaced.
@@ -266,32 +733,125 @@ class DeploymentEngine:
         FileName = os.path.basename(FilePath)
         ArchivePath = os.path.join(ArchiveDir, f"{FileName}.{Timestamp}")
         
-        # Copy the file to archive
-        shutil.copy2(FilePath, ArchivePath)
+        # Hard-link the file into the archive. Deployments swap in new files by
+        # rename, so the archived inode is never rewritten
+        try:
+            os.link(FilePath, ArchivePath)
+        except OSError:
+            # Hard links unsupported here; fall back to copying the data
+            shutil.copy2(FilePath, ArchivePath)
         
-        self.Logger.info(f"Archived file: {FilePath} -> {ArchivePath}")
+        self.Logger.debug("Archived file: %s -> %s", FilePath, ArchivePath)
         return ArchivePath
     
     def _CalculateFileChecksum(self, FilePath: str) -> str:
         """
         Calculate a checksum for a file.
         
+        Large files are memory-mapped and hashed in a single call; smaller
+        files are streamed through hashlib.file_digest (Python 3.11+) or read
+        in COPY_BLOCK_SIZE blocks. Files of MERKLE_HASH_THRESHOLD
+        bytes or more get a tree checksum (see _CalculateMerkleChecksum).
+        
         Args:
             FilePath: Path to the file
             
         Returns:
             str: Checksum hash
         """
-        if not os.path.exists(FilePath):
+        # Open the file directly rather than checking it exists first
+        try:
+            Hasher = self._CreateHasher()
+            
+            # BLAKE3 can hash a memory-mapped file using its own thread pool
+            if self.HashAlgorithm == "blake3":
+                Hasher.update_mmap(FilePath)
+                return Hasher.hexdigest()
+            
+            # Unbuffered: every read path below fills its own buffer
+            with open(FilePath, 'rb', buffering=0) as F:
+                FileSize = os.fstat(F.fileno()).st_size
+                
+                if FileSize >= MERKLE_HASH_THRESHOLD:
+                    return self._CalculateMerkleChecksum(F, FileSize)
+                
+                if FileSize >= MMAP_HASH_THRESHOLD:
+                    with mmap.mmap(F.fileno(), 0, access=mmap.ACCESS_READ) as Mapped:
+                        # Hint the kernel to read ahead aggressively
+                        if hasattr(mmap, "MADV_SEQUENTIAL"):
+                            Mapped.madvise(mmap.MADV_SEQUENTIAL)
+                        Hasher.update(Mapped)
+                elif hasattr(hashlib, "file_digest"):
+                    # Reads into one reusable buffer instead of allocating per block
+                    return hashlib.file_digest(F, lambda: Hasher).hexdigest()
+                else:
+                    while Chunk := F.read(COPY_BLOCK_SIZE):
+                        Hasher.update(Chunk)
+            
+            return Hasher.hexdigest()
+        except FileNotFoundError:
             return None
+    
+    def _CalculateMerkleChecksum(self, File: BinaryIO, FileSize: int) -> str:
+        """
+        Calculate a tree checksum for a large file by hashing chunks in parallel.
         
-        Hasher = hashlib.sha256()
+        The file is split into MERKLE_CHUNK_SIZE chunks that are hashed on a
+        thread pool; the checksum is the hash of the concatenated chunk digests.
+        The result differs from a plain hash of the file, so it is only
+        comparable with other checksums of files above MERKLE_HASH_THRESHOLD.
         
-        with open(FilePath, 'rb') as F:
-            for Chunk in iter(lambda: F.read(4096), b''):
-                Hasher.update(Chunk)
+        Args:
+            File: Open binary file to hash
+            FileSize: Size of the file in bytes
+            
+        Returns:
+            str: Root checksum hash
+        """
+        Offsets = range(0, FileSize, MERKLE_CHUNK_SIZE)
+        Workers = min(os.cpu_count() or 1, len(Offsets))
         
-        return Hasher.hexdigest()
+        with mmap.mmap(File.fileno(), 0, access=mmap.ACCESS_READ) as Mapped:
+            with memoryview(Mapped) as View:
+                def HashChunk(Offset: int) -> bytes:
+                    ChunkHasher = self._CreateHasher()
+                    with View[Offset:Offset + MERKLE_CHUNK_SIZE] as Chunk:
+                        ChunkHasher.update(Chunk)
+                    return ChunkHasher.digest()
+                
+                with ThreadPoolExecutor(max_workers=Workers) as Executor:
+                    Digests = list(Executor.map(HashChunk, Offsets))
+        
+        RootHasher = self._CreateHasher()
+        for Digest in Digests:
+            RootHasher.update(Digest)
+        
+        return RootHasher.hexdigest()
+    
+    def _CreateHasher(self) -> Any:
+        """
+        Create a new hash object for the configured checksum algorithm.
+        
+        Returns:
+            Any: Hash object supporting update() and hexdigest()
+            
+        Raises:
+            ValueError: If the algorithm is unknown or its package is not installed
+        """
+        if self.HashAlgorithm == "blake3":
+            if blake3 is None:
+                raise ValueError("Hash algorithm 'blake3' requires the blake3 package")
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        
+        if self.HashAlgorithm == "xxh3_128":
+            if xxhash is None:
+                raise ValueError("Hash algorithm 'xxh3_128' requires the xxhash package")
+            return xxhash.xxh3_128()
+        
+        try:
+            return hashlib.new(self.HashAlgorithm)
+        except ValueError:
+            raise ValueError(f"Unsupported hash algorithm: {self.HashAlgorithm}")
     
     def RollbackDeployment(self, TransactionId: str) -> bool:
         """
@@ -353,27 +913,27 @@ class DeploymentEngine:
                 self.Logger.info(f"Removed file during rollback: {DestinationPath}")
                 return True
             
-            # Find the most recent archived version (if any)
-            ArchiveFiles = []
-            for File in os.listdir(ArchiveDir):
-                if File.startswith(FileName + "."):
-                    ArchiveFiles.append(File)
+            # Find the most recent archived version (if any) in a single pass;
+            # the fixed-width timestamp suffix makes the greatest name the newest
+            ArchivePrefix = FileName + "."
+            LatestArchive = None
+            LatestName = ""
+            with os.scandir(ArchiveDir) as Entries:
+                for Entry in Entries:
+                    if Entry.name.startswith(ArchivePrefix) and Entry.name > LatestName:
+                        LatestName = Entry.name
+                        LatestArchive = Entry.path
             
-            if not ArchiveFiles:
+            if LatestArchive is None:
                 # No archived version, remove the file
                 os.remove(DestinationPath)
                 self.Logger.info(f"Removed file during rollback: {DestinationPath}")
                 return True
             
-            # Sort by timestamp (newest first)
-            ArchiveFiles.sort(reverse=True)
-            LatestArchive = os.path.join(ArchiveDir, ArchiveFiles[0])
-            
-            # Restore the file
-            shutil.copy2(LatestArchive, DestinationPath)
-            
-            # Clean up the archive file (optional)
-            os.remove(LatestArchive)
+            # Restore the file by renaming the archive back into place; the
+            # archive sits beside the destination, so this is a metadata-only
+            # atomic swap that also removes the archive entry
+            os.replace(LatestArchive, DestinationPath)
             
             self.Logger.info(f"Restored file during rollback: {LatestArchive} -> {DestinationPath}")
             return True
@@ -414,6 +974,11 @@ class DeploymentEngine:
                 (TransactionId,)
             )
             
+            # Group operations by file in a single pass
+            OperationsByFile = defaultdict(list)
+            for Operation in Operations:
+                OperationsByFile[Operation["file_id"]].append(Operation)
+            
             # Prepare file status information
             FileStatus = []
             for File in Files:
@@ -426,8 +991,7 @@ class DeploymentEngine:
                 }
                 
                 # Add operations for this file
-                FileOperations = [op for op in Operations if op["file_id"] == File["id"]]
-                FileInfo["operations"] = FileOperations
+                FileInfo["operations"] = OperationsByFile.get(File["id"], [])
                 
                 FileStatus.append(FileInfo)
             
@@ -472,45 +1036,43 @@ class DeploymentEngine:
         Returns:
             List[Dict[str, Any]]: List of deployment transactions
         """
-        Query = "SELECT * FROM transactions"
+        # File and successful operation counts are aggregated per transaction
+        # before joining, so the two counts do not multiply each other
+        Query = """
+        SELECT t.*,
+               COALESCE(f.count, 0) AS file_count,
+               COALESCE(o.count, 0) AS success_count
+        FROM transactions t
+        LEFT JOIN (
+            SELECT transaction_id, COUNT(*) AS count
+            FROM files
+            GROUP BY transaction_id
+        ) f ON f.transaction_id = t.id
+        LEFT JOIN (
+            SELECT transaction_id, COUNT(*) AS count
+            FROM operations
+            WHERE status = 'COMPLETED'
+            GROUP BY transaction_id
+        ) o ON o.transaction_id = t.id
+        """
         Parameters = []
         WhereClause = []
         
         if ProjectPath:
-            WhereClause.append("project_path = ?")
+            WhereClause.append("t.project_path = ?")
             Parameters.append(ProjectPath)
         
         if UserId:
-            WhereClause.append("user_id = ?")
+            WhereClause.append("t.user_id = ?")
             Parameters.append(UserId)
         
         if WhereClause:
             Query += " WHERE " + " AND ".join(WhereClause)
         
-        Query += " ORDER BY timestamp DESC LIMIT ?"
+        Query += " ORDER BY t.timestamp DESC LIMIT ?"
         Parameters.append(Limit)
         
-        Transactions = self.DatabaseManager.ExecuteQueryFetchAll(Query, tuple(Parameters))
-        
-        # Enhance with file counts
-        for Transaction in Transactions:
-            TransactionId = Transaction["id"]
-            
-            # Count files
-            FileCount = self.DatabaseManager.ExecuteQueryFetchOne(
-                "SELECT COUNT(*) as count FROM files WHERE transaction_id = ?",
-                (TransactionId,)
-            )
-            Transaction["file_count"] = FileCount["count"] if FileCount else 0
-            
-            # Count successful operations
-            SuccessCount = self.DatabaseManager.ExecuteQueryFetchOne(
-                "SELECT COUNT(*) as count FROM operations WHERE transaction_id = ? AND status = ?",
-                (TransactionId, "COMPLETED")
-            )
-            Transaction["success_count"] = SuccessCount["count"] if SuccessCount else 0
-        
-        return Transactions
+        return self.DatabaseManager.ExecuteQueryFetchAll(Query, tuple(Parameters))
 
 def Main():
     """Command-line interface for deployment operations."""
@@ -526,11 +1088,16 @@ def Main():
     Parser.add_argument("--project", required=True, help="Project path")
     Parser.add_argument("--user", default="admin", help="User ID")
     Parser.add_argument("--nobackup", action="store_true", help="Disable automatic backup")
+    Parser.add_argument("--verify", action="store_true", 
+                      help="Re-hash copies made on the same filesystem")
+    Parser.add_argument("--hash", default=DEFAULT_HASH_ALGORITHM,
+                        help="Checksum algorithm (e.g. sha256, blake2b, blake3, xxh3_128)")
     
     Args = Parser.parse_args()
     
     # Create deployment engine
-    Engine = DeploymentEngine(AutoBackup=not Args.nobackup)
+    Engine = DeploymentEngine(AutoBackup=not Args.nobackup, HashAlgorithm=Args.hash,
+                            VerifyAfterCopy=Args.verify)
     
     try:
         if Args.deploy:
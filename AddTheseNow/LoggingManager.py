@@ -14,6 +14,8 @@ with configurable output formats, log rotation, and multiple output destinations
 
 import os
 import sys
+import queue
+import atexit
 import logging
 import logging.handlers
 from pathlib import Path
@@ -36,6 +38,8 @@ class LoggingManager:
         LogLevel: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         FileHandler: Log file handler
         ConsoleHandler: Console output handler
+        LogQueue: Queue feeding the output handlers when queued logging is enabled
+        QueueListener: Background listener that drains LogQueue into the handlers
     """
     
     # Log format strings
@@ -58,7 +62,8 @@ class LoggingManager:
                LogLevel: Optional[str] = None,
                EnableConsole: bool = True,
                EnableFile: bool = True,
-               ColorOutput: bool = True):
+               ColorOutput: bool = True,
+               UseQueue: Optional[bool] = None):
         """
         Initialize the LoggingManager.
         
@@ -69,12 +74,21 @@ class LoggingManager:
             EnableConsole: Whether to enable console output
             EnableFile: Whether to enable file output
             ColorOutput: Whether to enable colored console output
+            UseQueue: Whether logging calls only enqueue records, leaving
+                handler output to a background thread. If None, uses value
+                from config.
         """
         self.ConfigManager = ConfigManager or ConfigManager()
         self.LogDir = LogDir or self._GetDefaultLogDir()
         self.LogLevel = LogLevel or self.ConfigManager.GetConfigValue("general.log_level", "INFO")
         self.FileHandler = None
         self.ConsoleHandler = None
+        self.LogQueue = None
+        self.QueueListener = None
+        self._QueuedHandlers: List[logging.Handler] = []
+        
+        if UseQueue is None:
+            UseQueue = self.ConfigManager.GetConfigValue("general.async_logging", False)
         
         # Ensure log directory exists
         os.makedirs(self.LogDir, exist_ok=True)
@@ -87,6 +101,12 @@ class LoggingManager:
         for Handler in RootLogger.handlers[:]:
             RootLogger.removeHandler(Handler)
         
+        # Route records through a queue so logging calls do not wait on output
+        if UseQueue:
+            self.LogQueue = queue.SimpleQueue()
+            RootLogger.addHandler(logging.handlers.QueueHandler(self.LogQueue))
+            atexit.register(self.Shutdown)
+        
         # Configure console output
         if EnableConsole:
             self._SetupConsoleHandler(ColorOutput)
@@ -138,7 +158,7 @@ class LoggingManager:
             Formatter = logging.Formatter(self.CONSOLE_FORMAT, self.DATE_FORMAT)
         
         self.ConsoleHandler.setFormatter(Formatter)
-        logging.getLogger().addHandler(self.ConsoleHandler)
+        self._AttachHandler(self.ConsoleHandler)
     
     def _SetupFileHandler(self) -> None:
         """
@@ -155,7 +175,56 @@ class LoggingManager:
         Formatter = logging.Formatter(self.FILE_FORMAT, self.DATE_FORMAT)
         self.FileHandler.setFormatter(Formatter)
         
-        logging.getLogger().addHandler(self.FileHandler)
+        self._AttachHandler(self.FileHandler)
+    
+    def _AttachHandler(self, Handler: logging.Handler) -> None:
+        """
+        Attach an output handler to the root logger or, when queued, to the listener.
+        
+        Args:
+            Handler: Handler to attach
+        """
+        if self.LogQueue is None:
+            logging.getLogger().addHandler(Handler)
+            return
+        
+        self._QueuedHandlers.append(Handler)
+        self._RestartQueueListener()
+    
+    def _DetachHandler(self, Handler: logging.Handler) -> None:
+        """
+        Detach an output handler attached with _AttachHandler.
+        
+        Args:
+            Handler: Handler to detach
+        """
+        if self.LogQueue is None:
+            logging.getLogger().removeHandler(Handler)
+            return
+        
+        if Handler in self._QueuedHandlers:
+            self._QueuedHandlers.remove(Handler)
+            self._RestartQueueListener()
+    
+    def _RestartQueueListener(self) -> None:
+        """
+        Restart the queue listener so it feeds the current set of handlers.
+        """
+        if self.QueueListener:
+            self.QueueListener.stop()
+        
+        self.QueueListener = logging.handlers.QueueListener(
+            self.LogQueue, *self._QueuedHandlers, respect_handler_level=True
+        )
+        self.QueueListener.start()
+    
+    def Shutdown(self) -> None:
+        """
+        Stop the queue listener after writing out any records still queued.
+        """
+        if self.QueueListener:
+            self.QueueListener.stop()
+            self.QueueListener = None
     
     class _ColoredFormatter(logging.Formatter):
         """
@@ -246,7 +315,7 @@ class LoggingManager:
         Formatter = logging.Formatter(self.FILE_FORMAT, self.DATE_FORMAT)
         Handler.setFormatter(Formatter)
         
-        logging.getLogger().addHandler(Handler)
+        self._AttachHandler(Handler)
         return Handler
     
     def GetLogFilePath(self) -> str:
@@ -271,8 +340,8 @@ class LoggingManager:
         
         # Close current file handler to release the file
         if self.FileHandler:
+            self._DetachHandler(self.FileHandler)
             self.FileHandler.close()
-            logging.getLogger().removeHandler(self.FileHandler)
         
         # Copy log files to archive directory
         for Filename in os.listdir(self.LogDir):
@@ -292,18 +361,20 @@ class LoggingManager:
         
         return ArchiveDir
 
-def SetupLogging(LogLevel: str = None, ConfigPath: str = None) -> LoggingManager:
+def SetupLogging(LogLevel: str = None, ConfigPath: str = None,
+                 ConfigMgr: Optional[ConfigManager] = None) -> LoggingManager:
     """
     Set up logging for the application.
     
     Args:
         LogLevel: Optional log level override
         ConfigPath: Optional path to configuration file
+        ConfigMgr: Optional already-loaded ConfigManager. If None, loads ConfigPath.
         
     Returns:
         LoggingManager: Configured logging manager
     """
-    ConfigMgr = ConfigManager(ConfigPath)
+    ConfigMgr = ConfigMgr or ConfigManager(ConfigPath)
     Manager = LoggingManager(ConfigMgr, LogLevel=LogLevel)
     
     # Get a logger for this module
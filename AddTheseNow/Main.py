@@ -18,289 +18,554 @@ import sys
 import argparse
 import logging
 from pathlib import Path
+from typing import Optional
 
-# Add project root to path
-ProjectRoot = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, ProjectRoot)
+# Application version reported by --version
+VERSION = "0.1.0"
 
-from Utils.ConfigManager import ConfigManager
-from Utils.LoggingManager import SetupLogging
-from Core.DatabaseManager import DatabaseManager
-from Core.TransactionManager import TransactionManager
-from Core.BackupManager import BackupManager
-from Core.ValidationEngine import ValidationEngine
-from Core.DeploymentEngine import DeploymentEngine
+# Banner shown at startup on interactive terminals
+_BANNER = r"""
+     _    ___ ___  _______     __    ___              _       
+    / \  |_ _|   \| ____\ \   / /   |   \ ___ _ __  | | ___  _   _
+   / _ \  | || |) |  _|  \ \ / /    | |) / -_) '_ \ | |/ _ \| | | |
+  / ___ \ | ||  __/| |___  \ V /    |___/\___| .__/ | | (_) | |_| |
+ /_/   \_\___|_|   |_____|  \_/             |_|    |_|\___/ \__, |
+                                                            |___/ 
+ 
+ File Deployment System with Validation and Rollback
+ Version """ + VERSION + r"""
+ Standard: AIDEV-PascalCase-1.6
+    """ + "\n\n"
+
+# Core and Utils modules are imported by the LazyComponents factories, so
+# startup only pays for the modules a command actually needs
+
+class DeferredLogger:
+    """
+    Logger that sets up logging the first time it is used.
+    
+    Commands that never log, such as "config --get", skip logging setup
+    entirely.
+    
+    Attributes:
+        Name: Logger name
+    """
+    
+    def __init__(self, Components: "LazyComponents", Name: str):
+        """
+        Initialize the logger without setting up logging.
+        
+        Args:
+            Components: Registry that provides the logging manager
+            Name: Logger name
+        """
+        self.Name = Name
+        self._Components = Components
+        self._Logger = None
+    
+    def __getattr__(self, Attribute: str):
+        """
+        Set up logging on first use and forward to the real logger.
+        
+        Args:
+            Attribute: Logger attribute, e.g. "info"
+            
+        Returns:
+            The attribute of the underlying logging.Logger
+        """
+        if self._Logger is None:
+            self._Logger = self._Components["logging_manager"].GetLogger(self.Name)
+        return getattr(self._Logger, Attribute)
 
-def InitializeComponents(ConfigPath: str = None) -> dict:
+class LazyComponents:
+    """
+    Core components, each built the first time it is requested.
+    
+    Commands only construct what they use: "config --get" never opens the
+    database, while "deploy" builds the full chain of managers. Components
+    are looked up by the same names InitializeComponents has always used.
+    
+    Attributes:
+        ConfigPath: Optional path to configuration file
+        UseConfigCache: Whether the configuration may be loaded from its parse cache
     """
-    Initialize all core components.
+    
+    def __init__(self, ConfigPath: str = None, UseConfigCache: bool = True):
+        """
+        Initialize the component registry without building anything.
+        
+        Args:
+            ConfigPath: Optional path to configuration file
+            UseConfigCache: Whether the configuration may be loaded from its parse cache
+        """
+        self.ConfigPath = ConfigPath
+        self.UseConfigCache = UseConfigCache
+        self._Components = {}
+        self._Factories = {
+            "config_manager": self._CreateConfigManager,
+            "logging_manager": self._CreateLoggingManager,
+            "database_manager": self._CreateDatabaseManager,
+            "transaction_manager": self._CreateTransactionManager,
+            "backup_manager": self._CreateBackupManager,
+            "validation_engine": self._CreateValidationEngine,
+            "deployment_engine": self._CreateDeploymentEngine,
+            "logger": self._CreateLogger
+        }
+    
+    def __getitem__(self, Name: str):
+        """
+        Get a component, building it and its dependencies on first access.
+        
+        Args:
+            Name: Component name
+            
+        Returns:
+            The component instance
+        """
+        if Name not in self._Components:
+            if Name not in self._Factories:
+                raise KeyError(Name)
+            self._Components[Name] = self._Factories[Name]()
+        return self._Components[Name]
+    
+    def _GetLogger(self):
+        """Get the logger used while building components."""
+        return self["logger"]
+    
+    def _CreateLogger(self):
+        """Build the application logger, deferring logging setup until it is used."""
+        return DeferredLogger(self, "Main")
+    
+    def _CreateConfigManager(self):
+        """Build the configuration manager."""
+        from Utils.ConfigManager import ConfigManager
+        return ConfigManager(self.ConfigPath, UseCache=self.UseConfigCache)
+    
+    def _CreateLoggingManager(self):
+        """Set up logging, reusing the loaded configuration."""
+        from Utils.LoggingManager import SetupLogging
+        return SetupLogging(ConfigMgr=self["config_manager"])
+    
+    def _CreateDatabaseManager(self):
+        """Open and initialize the database."""
+        from Core.DatabaseManager import DatabaseManager
+        
+        self._GetLogger().info("Initializing database...")
+        DbManager = DatabaseManager()
+        
+        # The schema only needs creating once per database
+        if not DbManager.IsSchemaCurrent():
+            DbManager.InitializeDatabase()
+        return DbManager
+    
+    def _CreateTransactionManager(self):
+        """Build the transaction manager."""
+        from Core.TransactionManager import TransactionManager
+        
+        DbManager = self["database_manager"]
+        
+        self._GetLogger().info("Initializing transaction manager...")
+        return TransactionManager(DbManager)
+    
+    def _CreateBackupManager(self):
+        """Build the backup manager."""
+        from Core.BackupManager import BackupManager
+        
+        DbManager = self["database_manager"]
+        
+        self._GetLogger().info("Initializing backup manager...")
+        return BackupManager(DbManager)
+    
+    def _CreateValidationEngine(self):
+        """Build the validation engine."""
+        from Core.ValidationEngine import ValidationEngine
+        
+        StandardVersion = self["config_manager"].GetConfigValue("validation.standards", "1.6")
+        
+        self._GetLogger().info("Initializing validation engine...")
+        return ValidationEngine(StandardVersion)
+    
+    def _CreateDeploymentEngine(self):
+        """Build the deployment engine and the managers it depends on."""
+        from Core.DeploymentEngine import DeploymentEngine
+        
+        ConfigMgr = self["config_manager"]
+        DbManager = self["database_manager"]
+        TransManager = self["transaction_manager"]
+        BackupMgr = self["backup_manager"]
+        ValidEngine = self["validation_engine"]
+        
+        self._GetLogger().info("Initializing deployment engine...")
+        return DeploymentEngine(
+            DbManager, 
+            TransManager, 
+            BackupMgr,
+            ValidEngine,
+            ConfigMgr.GetConfigValue("backup.auto_backup", True),
+            VerifyAfterCopy=ConfigMgr.GetConfigValue("deployment.verify_after_copy", False)
+        )
+
+def InitializeComponents(ConfigPath: str = None, UseConfigCache: bool = True) -> LazyComponents:
+    """
+    Prepare the core components.
+    
+    Components are built on first access, so nothing is constructed here.
     
     Args:
         ConfigPath: Optional path to configuration file
+        UseConfigCache: Whether the configuration may be loaded from its parse cache
+        
+    Returns:
+        LazyComponents: Components looked up by name, e.g. Components["backup_manager"]
+    """
+    return LazyComponents(ConfigPath, UseConfigCache)
+
+def WriteLines(Lines: list) -> None:
+    """
+    Write output lines to stdout in a single call.
+    
+    Args:
+        Lines: Lines of output, without trailing newlines
+    """
+    sys.stdout.write("\n".join(Lines) + "\n")
+
+def FormatIssues(Title: str, Issues: list, Indent: str = "") -> list:
+    """
+    Format validation errors or warnings as output lines.
+    
+    Args:
+        Title: Heading for the issues, e.g. "Errors"
+        Issues: Issues with "line" and "message" entries
+        Indent: Prefix for the heading; issues are indented two more spaces
         
     Returns:
-        dict: Dictionary of initialized components
+        list: Output lines, empty if there are no issues
     """
-    # Initialize configuration
-    ConfigMgr = ConfigManager(ConfigPath)
+    if not Issues:
+        return []
+    
+    return [f"{Indent}{Title}:"] + [
+        f"{Indent}  Line {Issue['line']}: {Issue['message']}" for Issue in Issues
+    ]
+
+def AddDeployArguments(Parser: argparse.ArgumentParser) -> None:
+    """Add the deploy command's arguments to its parser."""
+    Parser.add_argument("--source", nargs="+", required=True, help="Source file paths")
+    Parser.add_argument("--dest", nargs="+", required=True, help="Destination file paths")
+    Parser.add_argument("--project", required=True, help="Project path")
+    Parser.add_argument("--user", default="admin", help="User ID")
+    Parser.add_argument("--description", help="Deployment description")
+    Parser.add_argument("--nobackup", action="store_true", help="Disable automatic backup")
+    Parser.add_argument("--workers", type=int, default=None, 
+                      help="Files hashed and copied concurrently (default: CPU count)")
+
+def AddValidateArguments(Parser: argparse.ArgumentParser) -> None:
+    """Add the validate command's arguments to its parser."""
+    Parser.add_argument("files", nargs="+", help="Files to validate")
+    Parser.add_argument("--standard", help="Standard version")
+
+def AddBackupArguments(Parser: argparse.ArgumentParser) -> None:
+    """Add the backup command's arguments to its parser."""
+    Parser.add_argument("--project", required=True, help="Project path")
+    Parser.add_argument("--type", choices=["FULL", "PARTIAL", "CONFIG"], default="FULL", 
+                      help="Backup type")
+
+def AddRestoreArguments(Parser: argparse.ArgumentParser) -> None:
+    """Add the restore command's arguments to its parser."""
+    Parser.add_argument("backup_id", help="Backup ID")
+    Parser.add_argument("--output", help="Restore output path")
+
+def AddListArguments(Parser: argparse.ArgumentParser) -> None:
+    """Add the list command's arguments to its parser."""
+    Parser.add_argument("entity", choices=["backups", "deployments"], help="Entity type to list")
+    Parser.add_argument("--project", help="Project path")
+    Parser.add_argument("--limit", type=int, default=10, help="Maximum number of items to show")
+
+def AddInitArguments(Parser: argparse.ArgumentParser) -> None:
+    """The init command takes no arguments."""
+
+def AddConfigArguments(Parser: argparse.ArgumentParser) -> None:
+    """Add the config command's arguments to its parser."""
+    Parser.add_argument("--get", help="Get a configuration value")
+    Parser.add_argument("--set", help="Set a configuration value")
+    Parser.add_argument("--value", help="Value to set (used with --set)")
+    Parser.add_argument("--reset", action="store_true", help="Reset configuration to defaults")
+    Parser.add_argument("--list", action="store_true", help="List all configuration keys")
+    Parser.add_argument("--setup", action="store_true", help="Run interactive setup")
+
+def RunDeployCommand(Components: LazyComponents, Args: argparse.Namespace) -> int:
+    """Deploy files, reporting progress as the deployment runs."""
+    if len(Args.source) != len(Args.dest):
+        print("Error: Number of source and destination files must match")
+        return 1
+    
+    DeployEngine = Components["deployment_engine"]
+    
+    # Set auto_backup based on args
+    DeployEngine.AutoBackup = not Args.nobackup
+    
+    # Report progress as the deployment runs instead of after it finishes
+    ReportedIssues = False
+    for Event in DeployEngine.DeployFilesStreaming(
+        Args.source, Args.dest, Args.project, Args.user, Args.description,
+        Args.workers or os.cpu_count()
+    ):
+        if Event["type"] == "transaction":
+            WriteLines([f"Transaction ID: {Event['transaction_id']}"])
+        
+        elif Event["type"] == "validation" and Event["status"] != "PASS":
+            Lines = [] if ReportedIssues else ["\nValidation issues:"]
+            ReportedIssues = True
+            Lines.append(f"  File: {Event['path']}")
+            Lines.append(f"  Status: {Event['status']}")
+            Lines.extend(FormatIssues("Errors", Event["errors"], "  "))
+            Lines.extend(FormatIssues("Warnings", Event["warnings"], "  "))
+            Lines.append("")
+            WriteLines(Lines)
+        
+        elif Event["type"] == "result":
+            WriteLines([f"Deployment status: {Event['result']['status']}"])
+    
+    return 0
+
+def RunValidateCommand(Components: LazyComponents, Args: argparse.Namespace) -> int:
+    """Validate files and print the results in argument order."""
+    ValidEngine = Components["validation_engine"]
+    
+    # Set standard version if provided
+    if Args.standard:
+        ValidEngine.StandardVersion = Args.standard
+    
+    # ValidationEngine keeps no per-file state, so files can be
+    # validated on worker threads; map keeps the output in order
+    if len(Args.files) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=min(32, len(Args.files))) as Executor:
+            Results = list(Executor.map(ValidEngine.ValidateFile, Args.files))
+    else:
+        Results = [ValidEngine.ValidateFile(FilePath) for FilePath in Args.files]
+    
+    Lines = []
+    for FilePath, Result in zip(Args.files, Results):
+        Lines.append(f"Validating: {FilePath}")
+        Lines.append(f"Status: {Result['status']}")
+        Lines.extend(FormatIssues("Errors", Result["errors"]))
+        Lines.extend(FormatIssues("Warnings", Result["warnings"]))
+        Lines.append("")
+    
+    WriteLines(Lines)
+    return 0
+
+def RunBackupCommand(Components: LazyComponents, Args: argparse.Namespace) -> int:
+    """Create a backup of a project."""
+    BackupMgr = Components["backup_manager"]
+    
+    Result = BackupMgr.CreateBackup(Args.project, Args.type)
     
-    # Set up logging
-    LoggingMgr = SetupLogging(ConfigPath=ConfigPath)
-    Logger = LoggingMgr.GetLogger("Main")
+    print(f"Backup created: {Result['backup_id']}")
+    print(f"Path: {Result['path']}")
+    print(f"Size: {Result['size']} bytes")
+    print(f"Files: {Result['file_count']}")
+    return 0
+
+def RunRestoreCommand(Components: LazyComponents, Args: argparse.Namespace) -> int:
+    """Restore a project from a backup."""
+    BackupMgr = Components["backup_manager"]
+    
+    Result = BackupMgr.RestoreFromBackup(Args.backup_id, Args.output)
+    
+    print(f"Restore {'successful' if Result else 'failed'}")
+    return 0
+
+def RunListCommand(Components: LazyComponents, Args: argparse.Namespace) -> int:
+    """List backups or deployments."""
+    if Args.entity == "backups":
+        BackupMgr = Components["backup_manager"]
+        Backups = BackupMgr.ListBackups(Args.project, Args.limit)
+        
+        if not Backups:
+            print("No backups found")
+        else:
+            Lines = [f"Found {len(Backups)} backups:"]
+            for Backup in Backups:
+                Lines.append(
+                    f"  ID: {Backup['id']}\n"
+                    f"  Date: {Backup['timestamp']}\n"
+                    f"  Type: {Backup['backup_type']}\n"
+                    f"  Project: {Backup['project_path']}\n"
+                    f"  Verified: {'Yes' if Backup['verified'] else 'No'}\n"
+                )
+            WriteLines(Lines)
+    
+    elif Args.entity == "deployments":
+        DeployEngine = Components["deployment_engine"]
+        Deployments = DeployEngine.ListDeployments(
+            Args.project, Limit=Args.limit
+        )
+        
+        if not Deployments:
+            print("No deployments found")
+        else:
+            Lines = [f"Found {len(Deployments)} deployments:"]
+            for Deployment in Deployments:
+                Lines.append(
+                    f"  ID: {Deployment['id']}\n"
+                    f"  Time: {Deployment['timestamp']}\n"
+                    f"  Status: {Deployment['status']}\n"
+                    f"  Files: {Deployment['file_count']}\n"
+                    f"  Successful Operations: {Deployment['success_count']}\n"
+                )
+            WriteLines(Lines)
     
-    # Initialize database
-    Logger.info("Initializing database...")
-    DbManager = DatabaseManager()
+    return 0
+
+def RunInitCommand(Components: LazyComponents, Args: argparse.Namespace) -> int:
+    """Initialize the database schema."""
+    DbManager = Components["database_manager"]
     DbManager.InitializeDatabase()
+    print("Database initialized successfully")
+    return 0
+
+def RunConfigCommand(Components: LazyComponents, Args: argparse.Namespace) -> int:
+    """Get, set, reset, or list configuration values."""
+    ConfigMgr = Components["config_manager"]
     
-    # Initialize transaction manager
-    Logger.info("Initializing transaction manager...")
-    TransManager = TransactionManager(DbManager)
-    
-    # Initialize backup manager
-    Logger.info("Initializing backup manager...")
-    BackupMgr = BackupManager(DbManager)
-    
-    # Initialize validation engine
-    Logger.info("Initializing validation engine...")
-    StandardVersion = ConfigMgr.GetConfigValue("validation.standards", "1.6")
-    ValidEngine = ValidationEngine(StandardVersion)
-    
-    # Initialize deployment engine
-    Logger.info("Initializing deployment engine...")
-    DeployEngine = DeploymentEngine(
-        DbManager, 
-        TransManager, 
-        BackupMgr,
-        ValidEngine,
-        ConfigMgr.GetConfigValue("backup.auto_backup", True)
-    )
-    
-    Logger.info("All components initialized successfully")
-    
-    return {
-        "config_manager": ConfigMgr,
-        "logging_manager": LoggingMgr,
-        "database_manager": DbManager,
-        "transaction_manager": TransManager,
-        "backup_manager": BackupMgr,
-        "validation_engine": ValidEngine,
-        "deployment_engine": DeployEngine
-    }
-
-def RunCLI(Components: dict) -> int:
+    if Args.setup:
+        from Utils.ConfigManager import SetupInteractive
+        SetupInteractive()
+        
+    elif Args.get:
+        Value = ConfigMgr.GetConfigValue(Args.get)
+        print(f"{Args.get}: {Value}")
+        
+    elif Args.set:
+        if Args.value is None:
+            print("Error: --value is required with --set")
+            return 1
+        
+        ConfigMgr.SetConfigValue(Args.set, Args.value)
+        ConfigMgr.SaveConfig()
+        print(f"Set {Args.set} to {Args.value}")
+        
+    elif Args.reset:
+        ConfigMgr.ResetToDefaults()
+        print("Configuration reset to defaults")
+        
+    elif Args.list:
+        Keys = ConfigMgr.GetConfigKeys()
+        for Key in sorted(Keys):
+            Value = ConfigMgr.GetConfigValue(Key)
+            print(f"{Key}: {Value}")
+    
+    return 0
+
+# Subcommands: name -> (help text, argument builder, handler)
+COMMANDS = {
+    "deploy": ("Deploy files", AddDeployArguments, RunDeployCommand),
+    "validate": ("Validate files", AddValidateArguments, RunValidateCommand),
+    "backup": ("Create a backup", AddBackupArguments, RunBackupCommand),
+    "restore": ("Restore from backup", AddRestoreArguments, RunRestoreCommand),
+    "list": ("List entities", AddListArguments, RunListCommand),
+    "init": ("Initialize the database", AddInitArguments, RunInitCommand),
+    "config": ("Manage configuration", AddConfigArguments, RunConfigCommand)
+}
+
+# Global options that take a value, so the following argument is not the command
+GLOBAL_VALUE_OPTIONS = ("--config",)
+
+def FindCommand(Argv: list) -> Optional[str]:
     """
-    Run the command-line interface.
+    Find the subcommand in the command-line arguments without parsing them.
+    
+    Global options before the command are skipped, including the value of
+    "--config X" (also accepted abbreviated, as argparse allows).
     
     Args:
-        Components: Dictionary of initialized components
+        Argv: Command-line arguments, excluding the program name
         
     Returns:
-        int: Exit code
+        Optional[str]: Subcommand name, or None if the first positional
+            argument is not a known subcommand
     """
-    Logger = Components["logging_manager"].GetLogger("CLI")
-    Logger.info("Starting CLI interface")
+    Args = iter(Argv)
+    for Arg in Args:
+        if Arg == "--":
+            break
+        
+        if not Arg.startswith("-"):
+            return Arg if Arg in COMMANDS else None
+        
+        # "--config X" consumes the next argument; "--config=X" does not
+        if "=" not in Arg and len(Arg) > 2 and any(
+            Option.startswith(Arg) for Option in GLOBAL_VALUE_OPTIONS
+        ):
+            next(Args, None)
     
+    return None
+
+def BuildParser(Command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the command-line parser with the global options and subcommands.
+    
+    Args:
+        Command: Only add this subcommand's parser. If None, adds all of them,
+            as needed for the top-level help and for usage errors.
+    
+    Returns:
+        argparse.ArgumentParser: Configured parser
+    """
     Parser = argparse.ArgumentParser(description="AIDEV-Deploy: File Deployment System")
+    Parser.add_argument("--version", action="version", version=f"%(prog)s {VERSION}")
+    Parser.add_argument("--config", help="Path to configuration file")
+    Parser.add_argument("--gui", action="store_true", help="Start in GUI mode")
+    Parser.add_argument("--no-config-cache", dest="config_cache", action="store_false",
+                      help="Parse the configuration file instead of using its cache")
+    
     Subparsers = Parser.add_subparsers(dest="command", help="Command to execute")
     
-    # Deploy command
-    DeployParser = Subparsers.add_parser("deploy", help="Deploy files")
-    DeployParser.add_argument("--source", nargs="+", required=True, help="Source file paths")
-    DeployParser.add_argument("--dest", nargs="+", required=True, help="Destination file paths")
-    DeployParser.add_argument("--project", required=True, help="Project path")
-    DeployParser.add_argument("--user", default="admin", help="User ID")
-    DeployParser.add_argument("--description", help="Deployment description")
-    DeployParser.add_argument("--nobackup", action="store_true", help="Disable automatic backup")
-    
-    # Validate command
-    ValidateParser = Subparsers.add_parser("validate", help="Validate files")
-    ValidateParser.add_argument("files", nargs="+", help="Files to validate")
-    ValidateParser.add_argument("--standard", help="Standard version")
-    
-    # Backup command
-    BackupParser = Subparsers.add_parser("backup", help="Create a backup")
-    BackupParser.add_argument("--project", required=True, help="Project path")
-    BackupParser.add_argument("--type", choices=["FULL", "PARTIAL", "CONFIG"], default="FULL", 
-                          help="Backup type")
-    
-    # Restore command
-    RestoreParser = Subparsers.add_parser("restore", help="Restore from backup")
-    RestoreParser.add_argument("backup_id", help="Backup ID")
-    RestoreParser.add_argument("--output", help="Restore output path")
-    
-    # List command
-    ListParser = Subparsers.add_parser("list", help="List entities")
-    ListParser.add_argument("entity", choices=["backups", "deployments"], help="Entity type to list")
-    ListParser.add_argument("--project", help="Project path")
-    ListParser.add_argument("--limit", type=int, default=10, help="Maximum number of items to show")
-    
-    # Initialize command
-    InitParser = Subparsers.add_parser("init", help="Initialize the database")
-    
-    # Config command
-    ConfigParser = Subparsers.add_parser("config", help="Manage configuration")
-    ConfigParser.add_argument("--get", help="Get a configuration value")
-    ConfigParser.add_argument("--set", help="Set a configuration value")
-    ConfigParser.add_argument("--value", help="Value to set (used with --set)")
-    ConfigParser.add_argument("--reset", action="store_true", help="Reset configuration to defaults")
-    ConfigParser.add_argument("--list", action="store_true", help="List all configuration keys")
-    ConfigParser.add_argument("--setup", action="store_true", help="Run interactive setup")
-    
-    # Parse args and handle commands
-    Args = Parser.parse_args()
+    for Name, (Help, AddArguments, _) in COMMANDS.items():
+        if Command is None or Name == Command:
+            AddArguments(Subparsers.add_parser(Name, help=Help))
     
-    try:
-        if Args.command == "deploy":
-            if len(Args.source) != len(Args.dest):
-                print("Error: Number of source and destination files must match")
-                return 1
-            
-            # Set auto_backup based on args
-            Components["deployment_engine"].AutoBackup = not Args.nobackup
-            
-            Result = Components["deployment_engine"].DeployFiles(
-                Args.source, Args.dest, Args.project, Args.user, Args.description
-            )
-            
-            print(f"Deployment status: {Result['status']}")
-            print(f"Transaction ID: {Result['transaction_id']}")
-            
-            if Result['status'] == "VALIDATION_FAILED":
-                print("\nValidation issues:")
-                for FileId, FileInfo in Result["validation_results"]["files"].items():
-                    if FileInfo["status"] != "PASS":
-                        print(f"  File: {FileInfo['path']}")
-                        print(f"  Status: {FileInfo['status']}")
-                        
-                        if FileInfo["errors"]:
-                            print("  Errors:")
-                            for Error in FileInfo["errors"]:
-                                print(f"    Line {Error['line']}: {Error['message']}")
-                        
-                        if FileInfo["warnings"]:
-                            print("  Warnings:")
-                            for Warning in FileInfo["warnings"]:
-                                print(f"    Line {Warning['line']}: {Warning['message']}")
-                        
-                        print()
-        
-        elif Args.command == "validate":
-            ValidEngine = Components["validation_engine"]
-            
-            # Set standard version if provided
-            if Args.standard:
-                ValidEngine.StandardVersion = Args.standard
-            
-            for FilePath in Args.files:
-                print(f"Validating: {FilePath}")
-                Result = ValidEngine.ValidateFile(FilePath)
-                
-                print(f"Status: {Result['status']}")
-                
-                if Result["errors"]:
-                    print("Errors:")
-                    for Error in Result["errors"]:
-                        print(f"  Line {Error['line']}: {Error['message']}")
-                
-                if Result["warnings"]:
-                    print("Warnings:")
-                    for Warning in Result["warnings"]:
-                        print(f"  Line {Warning['line']}: {Warning['message']}")
-                
-                print()
-        
-        elif Args.command == "backup":
-            BackupMgr = Components["backup_manager"]
-            
-            Result = BackupMgr.CreateBackup(Args.project, Args.type)
-            
-            print(f"Backup created: {Result['backup_id']}")
-            print(f"Path: {Result['path']}")
-            print(f"Size: {Result['size']} bytes")
-            print(f"Files: {Result['file_count']}")
-        
-        elif Args.command == "restore":
-            BackupMgr = Components["backup_manager"]
-            
-            Result = BackupMgr.RestoreFromBackup(Args.backup_id, Args.output)
-            
-            print(f"Restore {'successful' if Result else 'failed'}")
-        
-        elif Args.command == "list":
-            if Args.entity == "backups":
-                Backups = Components["backup_manager"].ListBackups(Args.project, Args.limit)
-                
-                if not Backups:
-                    print("No backups found")
-                else:
-                    print(f"Found {len(Backups)} backups:")
-                    for Backup in Backups:
-                        print(f"  ID: {Backup['id']}")
-                        print(f"  Date: {Backup['timestamp']}")
-                        print(f"  Type: {Backup['backup_type']}")
-                        print(f"  Project: {Backup['project_path']}")
-                        print(f"  Verified: {'Yes' if Backup['verified'] else 'No'}")
-                        print()
-            
-            elif Args.entity == "deployments":
-                Deployments = Components["deployment_engine"].ListDeployments(
-                    Args.project, limit=Args.limit
-                )
-                
-                if not Deployments:
-                    print("No deployments found")
-                else:
-                    print(f"Found {len(Deployments)} deployments:")
-                    for Deployment in Deployments:
-                        print(f"  ID: {Deployment['id']}")
-                        print(f"  Time: {Deployment['timestamp']}")
-                        print(f"  Status: {Deployment['status']}")
-                        print(f"  Files: {Deployment['file_count']}")
-                        print(f"  Successful Operations: {Deployment['success_count']}")
-                        print()
-        
-        elif Args.command == "init":
-            Components["database_manager"].InitializeDatabase()
-            print("Database initialized successfully")
-        
-        elif Args.command == "config":
-            ConfigMgr = Components["config_manager"]
-            
-            if Args.setup:
-                from Utils.ConfigManager import SetupInteractive
-                SetupInteractive()
-                
-            elif Args.get:
-                Value = ConfigMgr.GetConfigValue(Args.get)
-                print(f"{Args.get}: {Value}")
-                
-            elif Args.set:
-                if Args.value is None:
-                    print("Error: --value is required with --set")
-                    return 1
-                
-                ConfigMgr.SetConfigValue(Args.set, Args.value)
-                ConfigMgr.SaveConfig()
-                print(f"Set {Args.set} to {Args.value}")
-                
-            elif Args.reset:
-                ConfigMgr.ResetToDefaults()
-                print("Configuration reset to defaults")
-                
-            elif Args.list:
-                Keys = ConfigMgr.GetConfigKeys()
-                for Key in sorted(Keys):
-                    Value = ConfigMgr.GetConfigValue(Key)
-                    print(f"{Key}: {Value}")
+    return Parser
+
+def ParseArguments(Argv: Optional[list] = None) -> argparse.Namespace:
+    """
+    Parse the command line, building only the parser for the chosen subcommand.
+    
+    Args:
+        Argv: Command-line arguments, excluding the program name. If None, uses sys.argv.
         
-        else:
-            Parser.print_help()
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    if Argv is None:
+        Argv = sys.argv[1:]
+    
+    return BuildParser(FindCommand(Argv)).parse_args(Argv)
+
+def RunCLI(Components: LazyComponents, Args: argparse.Namespace) -> int:
+    """
+    Run the command-line interface.
+    
+    Args:
+        Components: Core components, built on first access
+        Args: Parsed command-line arguments
         
+    Returns:
+        int: Exit code
+    """
+    if Args.command not in COMMANDS:
+        BuildParser().print_help()
         return 0
+    
+    try:
+        Handler = COMMANDS[Args.command][2]
+        return Handler(Components, Args)
         
     except Exception as E:
-        Logger.error(f"Error: {E}", exc_info=True)
+        Components["logger"].error(f"Error: {E}", exc_info=True)
         print(f"Error: {E}")
         return 1
 
@@ -316,21 +581,9 @@ def RunGUI():
     return 1
 
 def PrintBanner():
-    """Print the application banner."""
-    Banner = r"""
-     _    ___ ___  _______     __    ___              _       
-    / \  |_ _|   \| ____\ \   / /   |   \ ___ _ __  | | ___  _   _
-   / _ \  | || |) |  _|  \ \ / /    | |) / -_) '_ \ | |/ _ \| | | |
-  / ___ \ | ||  __/| |___  \ V /    |___/\___| .__/ | | (_) | |_| |
- /_/   \_\___|_|   |_____|  \_/             |_|    |_|\___/ \__, |
-                                                            |___/ 
- 
- File Deployment System with Validation and Rollback
- Version 0.1.0
- Standard: AIDEV-PascalCase-1.6
-    """
-    print(Banner)
-    print()
+    """Print the application banner when writing to a terminal."""
+    if sys.stdout.isatty():
+        sys.stdout.write(_BANNER)
 
 def Main():
     """
@@ -339,26 +592,22 @@ def Main():
     Returns:
         int: Exit code
     """
-    # Display banner
-    PrintBanner()
-    
-    # Parse command line arguments
-    Parser = argparse.ArgumentParser(description="AIDEV-Deploy: File Deployment System")
-    Parser.add_argument("--config", help="Path to configuration file")
-    Parser.add_argument("--gui", action="store_true", help="Start in GUI mode")
+    # Parse command line arguments once, global options and subcommand together;
+    # --help, --version, and usage errors exit here before any setup
+    Args = ParseArguments()
     
-    # Parse args before command subparsers
-    Args, _ = Parser.parse_known_args()
+    # Display banner for interactive use only
+    PrintBanner()
     
     try:
         # Initialize components
-        Components = InitializeComponents(Args.config)
+        Components = InitializeComponents(Args.config, Args.config_cache)
         
         # Run in GUI or CLI mode
         if Args.gui:
             return RunGUI()
         else:
-            return RunCLI(Components)
+            return RunCLI(Components, Args)
             
     except Exception as E:
         print(f"Initialization error: {E}")
@@ -367,4 +616,12 @@ def Main():
         return 1
 
 if __name__ == "__main__":
+    # Add project root to path when run as a script; importing Main as a
+    # library or from a zipapp leaves sys.path alone
+    ProjectRoot = os.path.dirname(__file__)
+    if not os.path.isabs(ProjectRoot):
+        ProjectRoot = os.path.abspath(ProjectRoot)
+    if ProjectRoot not in sys.path:
+        sys.path.insert(0, ProjectRoot)
+    
     sys.exit(Main())
@@ -0,0 +1,152 @@
+# File: TestConfigManager.py
+# Path: AIDEV-Deploy/Tests/TestConfigManager.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-16
+# Last Modified: 2026-10-16
+# Description: Tests for the ConfigManager parse cache and validation stamp
+
+"""
+TestConfigManager Module
+
+This module contains tests for the ConfigManager component to ensure its
+parse cache and validation stamp are only reused for an unchanged file.
+"""
+
+import os
+import sys
+import json
+import unittest
+import tempfile
+from unittest import mock
+
+# Add project root to path
+ProjectRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ProjectRoot)
+
+from Utils import ConfigManager as ConfigModule
+from Utils.ConfigManager import ConfigManager
+from Main import InitializeComponents, ParseArguments
+
+class TestConfigManager(unittest.TestCase):
+    """Test case for ConfigManager."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.TempDir = tempfile.TemporaryDirectory()
+        self.TempPath = self.TempDir.name
+        self.ConfigPath = os.path.join(self.TempPath, "config.yaml")
+        
+        # Keep the parse cache inside the test directory
+        self.EnvPatch = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": os.path.join(self.TempPath, "cache")})
+        self.EnvPatch.start()
+        for Name in [Name for Name in os.environ if Name.startswith(ConfigModule.ENV_VAR_PREFIX)]:
+            del os.environ[Name]
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        self.EnvPatch.stop()
+        self.TempDir.cleanup()
+    
+    def WriteConfig(self, Text):
+        """Write the configuration file."""
+        with open(self.ConfigPath, "w") as File:
+            File.write(Text)
+    
+    def TamperCache(self, Manager, RetentionCount):
+        """Replace the cached value of backup.retention_count, keeping the cache key."""
+        CachePath = Manager._GetConfigCachePath()
+        with open(CachePath) as File:
+            Cached = json.load(File)
+        Cached["config"]["backup"]["retention_count"] = RetentionCount
+        with open(CachePath, "w") as File:
+            json.dump(Cached, File)
+    
+    def test_cache_used_for_unchanged_file(self):
+        """An unchanged file is loaded from the cache."""
+        self.WriteConfig("backup:\n  retention_count: 3\n")
+        Manager = ConfigManager(self.ConfigPath)
+        self.assertTrue(os.path.exists(Manager._GetConfigCachePath()))
+        
+        self.TamperCache(Manager, 42)
+        self.assertEqual(ConfigManager(self.ConfigPath).GetConfigValue("backup.retention_count"), 42)
+    
+    def test_cache_invalidated_when_size_changes(self):
+        """A file whose size changed is parsed again."""
+        self.WriteConfig("backup:\n  retention_count: 3\n")
+        Manager = ConfigManager(self.ConfigPath)
+        self.TamperCache(Manager, 42)
+        
+        Stat = os.stat(self.ConfigPath)
+        self.WriteConfig("backup:\n  retention_count: 30\n")
+        os.utime(self.ConfigPath, ns=(Stat.st_atime_ns, Stat.st_mtime_ns))
+        
+        self.assertEqual(ConfigManager(self.ConfigPath).GetConfigValue("backup.retention_count"), 30)
+    
+    def test_cache_invalidated_when_mtime_changes(self):
+        """A file with the same size but a new mtime is parsed again."""
+        self.WriteConfig("backup:\n  retention_count: 3\n")
+        Manager = ConfigManager(self.ConfigPath)
+        self.TamperCache(Manager, 42)
+        
+        Stat = os.stat(self.ConfigPath)
+        self.WriteConfig("backup:\n  retention_count: 4\n")
+        os.utime(self.ConfigPath, ns=(Stat.st_atime_ns, Stat.st_mtime_ns + 1_000_000_000))
+        
+        self.assertEqual(ConfigManager(self.ConfigPath).GetConfigValue("backup.retention_count"), 4)
+    
+    def test_cache_invalidated_on_version_bump(self):
+        """A cache written by another cache format version is ignored."""
+        self.WriteConfig("backup:\n  retention_count: 3\n")
+        Manager = ConfigManager(self.ConfigPath)
+        self.TamperCache(Manager, 42)
+        
+        with mock.patch.object(ConfigModule, "CONFIG_CACHE_VERSION", ConfigModule.CONFIG_CACHE_VERSION + 1):
+            self.assertEqual(ConfigManager(self.ConfigPath).GetConfigValue("backup.retention_count"), 3)
+    
+    def test_no_config_cache_bypasses_cache(self):
+        """--no-config-cache parses the file even when the cache is current."""
+        self.WriteConfig("backup:\n  retention_count: 3\n")
+        Manager = ConfigManager(self.ConfigPath)
+        self.TamperCache(Manager, 42)
+        
+        Args = ParseArguments(["--no-config-cache", "--config", self.ConfigPath, "init"])
+        self.assertFalse(Args.config_cache)
+        
+        Components = InitializeComponents(Args.config, Args.config_cache)
+        self.assertEqual(Components["config_manager"].GetConfigValue("backup.retention_count"), 3)
+        self.assertEqual(ConfigManager(self.ConfigPath, UseCache=False).GetConfigValue("backup.retention_count"), 3)
+    
+    def test_save_removes_stamp_and_cache(self):
+        """SaveConfig removes the validation stamp and the parse cache."""
+        self.WriteConfig("backup:\n  retention_count: 3\n")
+        Manager = ConfigManager(self.ConfigPath)
+        StampPath = Manager._GetValidationStampPath()
+        CachePath = Manager._GetConfigCachePath()
+        self.assertTrue(os.path.exists(StampPath))
+        self.assertTrue(os.path.exists(CachePath))
+        
+        Manager.SetConfigValue("backup.retention_count", 5)
+        Manager.SaveConfig()
+        
+        self.assertFalse(os.path.exists(StampPath))
+        self.assertFalse(os.path.exists(CachePath))
+        self.assertEqual(ConfigManager(self.ConfigPath).GetConfigValue("backup.retention_count"), 5)
+    
+    def test_invalid_value_reported_after_cache_hit(self):
+        """A value that fails validation is reported on every load, cached or not."""
+        self.WriteConfig("backup:\n  retention_count: abc\n")
+        with self.assertLogs("ConfigManager", "WARNING"):
+            Manager = ConfigManager(self.ConfigPath)
+        self.assertFalse(os.path.exists(Manager._GetValidationStampPath()))
+        self.assertTrue(os.path.exists(Manager._GetConfigCachePath()))
+        
+        with mock.patch.object(ConfigModule.yaml, "load", side_effect=AssertionError("parsed")):
+            with self.assertLogs("ConfigManager", "WARNING") as Logs:
+                Manager = ConfigManager(self.ConfigPath)
+        
+        self.assertTrue(any("Invalid type for backup.retention_count" in Line for Line in Logs.output))
+        self.assertEqual(Manager.GetConfigValue("backup.retention_count"),
+                         Manager.GetDefaultConfigValue("backup.retention_count"))
+
+if __name__ == "__main__":
+    unittest.main()
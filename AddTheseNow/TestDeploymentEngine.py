@@ -0,0 +1,187 @@
+# File: TestDeploymentEngine.py
+# Path: AIDEV-Deploy/Tests/TestDeploymentEngine.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-16
+# Last Modified: 2026-10-16
+# Description: Tests for the DeploymentEngine component
+
+"""
+TestDeploymentEngine Module
+
+This module contains tests for the DeploymentEngine component to ensure
+files are copied, archived and restored correctly on every copy path.
+"""
+
+import os
+import sys
+import errno
+import unittest
+import tempfile
+from unittest import mock
+
+# Add project root to path
+ProjectRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ProjectRoot)
+
+from Core.DatabaseManager import DatabaseManager
+from Core.BackupManager import BackupManager
+from Core.DeploymentEngine import DeploymentEngine
+
+# Header that passes validation against the AIDEV-PascalCase-1.6 standard
+HEADER = '''# File: {Name}
+# Path: Project/{Name}
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2025-03-21
+# Last Modified: 2025-03-21  5:30PM
+# Description: Test module
+
+"""
+Test module.
+"""
+
+Value = {Value}
+'''
+
+class TestDeploymentEngine(unittest.TestCase):
+    """Test case for DeploymentEngine."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.TempDir = tempfile.TemporaryDirectory()
+        self.TempPath = self.TempDir.name
+        self.ProjectPath = os.path.join(self.TempPath, "project")
+        self.SourceDir = os.path.join(self.TempPath, "source")
+        os.makedirs(os.path.join(self.ProjectPath, "pkg"))
+        os.makedirs(self.SourceDir)
+        
+        self.DbManager = DatabaseManager(os.path.join(self.TempPath, "test.db"))
+        self.DbManager.InitializeDatabase()
+        self.Engine = DeploymentEngine(
+            self.DbManager,
+            BackupMgr=BackupManager(self.DbManager, BackupLocation=os.path.join(self.TempPath, "backups")),
+            AutoBackup=False
+        )
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        self.DbManager.Close()
+        self.TempDir.cleanup()
+    
+    def WriteSource(self, Name, Value):
+        """Write a valid Python source file and return its path."""
+        SourcePath = os.path.join(self.SourceDir, Name)
+        with open(SourcePath, "w") as File:
+            File.write(HEADER.format(Name=Name, Value=Value))
+        return SourcePath
+    
+    def ReadFile(self, FilePath):
+        """Read a file's contents."""
+        with open(FilePath) as File:
+            return File.read()
+    
+    def test_deploy_rollback_redeploy(self):
+        """A replaced file is archived, restored on rollback, and archived again on redeploy."""
+        SourcePath = self.WriteSource("Module.py", 1)
+        DestPath = os.path.join(self.ProjectPath, "pkg", "Module.py")
+        ArchiveDir = os.path.join(self.ProjectPath, "pkg", ".archive")
+        with open(DestPath, "w") as File:
+            File.write("old\n")
+        OldInode = os.stat(DestPath).st_ino
+        
+        Result = self.Engine.DeployFiles([SourcePath], [DestPath], self.ProjectPath)
+        self.assertEqual(Result["status"], "COMPLETED")
+        self.assertEqual(self.ReadFile(DestPath), self.ReadFile(SourcePath))
+        
+        # The old file was hard-linked into the archive and the new one renamed over it
+        Archived = os.listdir(ArchiveDir)
+        self.assertEqual(len(Archived), 1)
+        self.assertEqual(os.stat(os.path.join(ArchiveDir, Archived[0])).st_ino, OldInode)
+        self.assertNotEqual(os.stat(DestPath).st_ino, OldInode)
+        
+        # No temporary files are left beside the destination
+        self.assertEqual(sorted(os.listdir(os.path.dirname(DestPath))), [".archive", "Module.py"])
+        
+        # Rollback renames the archived file back into place
+        self.assertTrue(self.Engine.RollbackDeployment(Result["transaction_id"]))
+        self.assertEqual(self.ReadFile(DestPath), "old\n")
+        self.assertEqual(os.stat(DestPath).st_ino, OldInode)
+        self.assertEqual(os.listdir(ArchiveDir), [])
+        
+        # Redeploying archives the restored file again
+        Result = self.Engine.DeployFiles([SourcePath], [DestPath], self.ProjectPath)
+        self.assertEqual(Result["status"], "COMPLETED")
+        self.assertEqual(self.ReadFile(DestPath), self.ReadFile(SourcePath))
+        Archived = os.listdir(ArchiveDir)
+        self.assertEqual(len(Archived), 1)
+        self.assertEqual(self.ReadFile(os.path.join(ArchiveDir, Archived[0])), "old\n")
+    
+    def test_rollback_removes_new_file(self):
+        """Rolling back a file that had no previous version removes it."""
+        SourcePath = self.WriteSource("NewModule.py", 2)
+        DestPath = os.path.join(self.ProjectPath, "pkg", "NewModule.py")
+        
+        Result = self.Engine.DeployFiles([SourcePath], [DestPath], self.ProjectPath)
+        self.assertEqual(Result["status"], "COMPLETED")
+        self.assertTrue(os.path.exists(DestPath))
+        
+        self.assertTrue(self.Engine.RollbackDeployment(Result["transaction_id"]))
+        self.assertFalse(os.path.exists(DestPath))
+    
+    def test_copy_falls_back_to_sendfile(self):
+        """An unsupported copy_file_range falls back to sendfile."""
+        if not sys.platform.startswith("linux"):
+            self.skipTest("sendfile copies are only used on Linux")
+        
+        SourcePath = self.WriteSource("Module.py", 3)
+        DestPath = os.path.join(self.TempPath, "copy.py")
+        
+        with mock.patch.object(os, "copy_file_range", create=True,
+                               side_effect=OSError(errno.EXDEV, "Cross-device link")):
+            Method = self.Engine._CopyFile(SourcePath, DestPath)
+        
+        self.assertEqual(Method, "sendfile")
+        self.assertEqual(self.ReadFile(DestPath), self.ReadFile(SourcePath))
+    
+    def test_copy_falls_back_to_copyfileobj(self):
+        """With no kernel copy available, the data is copied in userspace."""
+        SourcePath = self.WriteSource("Module.py", 4)
+        DestPath = os.path.join(self.TempPath, "copy.py")
+        
+        Unsupported = OSError(errno.EINVAL, "Invalid argument")
+        with mock.patch.object(os, "copy_file_range", create=True, side_effect=Unsupported), \
+             mock.patch.object(os, "sendfile", create=True, side_effect=Unsupported):
+            Method = self.Engine._CopyFile(SourcePath, DestPath)
+        
+        self.assertEqual(Method, "copyfileobj")
+        self.assertEqual(self.ReadFile(DestPath), self.ReadFile(SourcePath))
+        self.assertEqual(os.stat(DestPath).st_mtime_ns, os.stat(SourcePath).st_mtime_ns)
+    
+    def test_deploy_with_forced_fallback_copy(self):
+        """A deployment still copies and verifies files when kernel copies are unsupported."""
+        SourcePath = self.WriteSource("Module.py", 5)
+        DestPath = os.path.join(self.ProjectPath, "pkg", "Module.py")
+        
+        Unsupported = OSError(errno.EINVAL, "Invalid argument")
+        with mock.patch.object(os, "copy_file_range", create=True, side_effect=Unsupported), \
+             mock.patch.object(os, "sendfile", create=True, side_effect=Unsupported), \
+             mock.patch.object(self.Engine, "_CopyFile", wraps=self.Engine._CopyFile) as CopyFile:
+            Result = self.Engine.DeployFiles([SourcePath], [DestPath], self.ProjectPath)
+        
+        self.assertEqual(Result["status"], "COMPLETED")
+        self.assertTrue(CopyFile.called)
+        self.assertEqual(self.ReadFile(DestPath), self.ReadFile(SourcePath))
+    
+    def test_archive_falls_back_to_copy(self):
+        """Archiving copies the file when it cannot be hard-linked."""
+        FilePath = os.path.join(self.ProjectPath, "pkg", "Module.py")
+        with open(FilePath, "w") as File:
+            File.write("old\n")
+        
+        with mock.patch.object(os, "link", side_effect=OSError(errno.EPERM, "Operation not permitted")):
+            ArchivePath = self.Engine._ArchiveExistingFile(FilePath)
+        
+        self.assertEqual(self.ReadFile(ArchivePath), "old\n")
+        self.assertNotEqual(os.stat(ArchivePath).st_ino, os.stat(FilePath).st_ino)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+# File: TestTransactionManager.py
+# Path: AIDEV-Deploy/Tests/TestTransactionManager.py
+# Standard: AIDEV-PascalCase-1.6
+# Created: 2026-10-16
+# Last Modified: 2026-10-16
+# Description: Tests for the TransactionManager component
+
+"""
+TestTransactionManager Module
+
+This module contains tests for the TransactionManager component to ensure
+failed executions record and roll back every file that was deployed.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import unittest
+import tempfile
+import threading
+
+# Add project root to path
+ProjectRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ProjectRoot)
+
+from Core.DatabaseManager import DatabaseManager
+from Core.TransactionManager import TransactionManager
+
+class TestTransactionManager(unittest.TestCase):
+    """Test case for TransactionManager."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.TempDir = tempfile.TemporaryDirectory()
+        self.TempPath = self.TempDir.name
+        self.DbManager = DatabaseManager(os.path.join(self.TempPath, "test.db"))
+        self.DbManager.InitializeDatabase()
+        self.TransactionManager = TransactionManager(self.DbManager)
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        self.DbManager.Close()
+        self.TempDir.cleanup()
+    
+    def test_execute_async_waits_for_running_callbacks(self):
+        """A callback still running when a sibling fails is awaited and rolled back."""
+        TransactionId = self.TransactionManager.CreateTransaction("admin", self.TempPath)
+        Files = []
+        for Name in ("fail.py", "slow.py"):
+            SourcePath = os.path.join(self.TempPath, Name)
+            with open(SourcePath, "w") as File:
+                File.write("x = 1\n")
+            Files.append((SourcePath, SourcePath + ".out", None))
+        self.TransactionManager.AddFilesToTransaction(TransactionId, Files)
+        self.TransactionManager.ValidateTransaction(TransactionId, lambda Path: {"status": "PASS"})
+        
+        SlowStarted = threading.Event()
+        SlowFinished = threading.Event()
+        
+        def Deploy(SourcePath, DestinationPath):
+            if SourcePath.endswith("fail.py"):
+                # Fail only once the slow callback is already running
+                SlowStarted.wait(5)
+                return False
+            SlowStarted.set()
+            time.sleep(0.2)
+            SlowFinished.set()
+            return True
+        
+        with self.assertRaises(RuntimeError) as Context:
+            asyncio.run(self.TransactionManager.ExecuteTransactionAsync(
+                TransactionId, None, Deploy, MaxWorkers=2
+            ))
+        
+        # The slow callback finished before the failure was reported
+        self.assertTrue(SlowFinished.is_set())
+        self.assertIn("fail.py", str(Context.exception))
+        self.assertNotIn("slow.py", str(Context.exception))
+        
+        # Its deployment was recorded and then rolled back
+        Rows = self.DbManager.ExecuteQueryFetchAll(
+            "SELECT destination_path, status FROM operations WHERE transaction_id = ? AND operation_type != 'ROLLBACK'",
+            (TransactionId,)
+        )
+        Statuses = {os.path.basename(Row["destination_path"]): Row["status"] for Row in Rows}
+        self.assertEqual(Statuses["slow.py.out"], "ROLLED_BACK")
+        self.assertEqual(Statuses["fail.py.out"], "FAILED")
+        self.assertEqual(self.TransactionManager.GetTransactionStatus(TransactionId), "FAILED")
+    
+    def test_execute_async_cancelled_waits_for_running_callbacks(self):
+        """Cancelling an execution awaits running callbacks, then fails and rolls back."""
+        TransactionId = self.TransactionManager.CreateTransaction("admin", self.TempPath)
+        Files = []
+        for Name in ("slow.py", "queued.py"):
+            SourcePath = os.path.join(self.TempPath, Name)
+            with open(SourcePath, "w") as File:
+                File.write("x = 1\n")
+            Files.append((SourcePath, SourcePath + ".out", None))
+        self.TransactionManager.AddFilesToTransaction(TransactionId, Files)
+        self.TransactionManager.ValidateTransaction(TransactionId, lambda Path: {"status": "PASS"})
+        
+        SlowFinished = threading.Event()
+        Started = []
+        
+        def Deploy(SourcePath, DestinationPath):
+            Started.append(os.path.basename(SourcePath))
+            time.sleep(0.3)
+            SlowFinished.set()
+            return True
+        
+        async def Run():
+            await asyncio.wait_for(self.TransactionManager.ExecuteTransactionAsync(
+                TransactionId, None, Deploy, MaxWorkers=1
+            ), 0.1)
+        
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(Run())
+        
+        # The running callback finished; the queued one never started
+        self.assertTrue(SlowFinished.is_set())
+        self.assertEqual(Started, ["slow.py"])
+        
+        Rows = self.DbManager.ExecuteQueryFetchAll(
+            "SELECT destination_path, status FROM operations WHERE transaction_id = ? AND operation_type != 'ROLLBACK'",
+            (TransactionId,)
+        )
+        Statuses = {os.path.basename(Row["destination_path"]): Row["status"] for Row in Rows}
+        self.assertEqual(Statuses["slow.py.out"], "ROLLED_BACK")
+        self.assertEqual(Statuses["queued.py.out"], "FAILED")
+        self.assertEqual(self.TransactionManager.GetTransactionStatus(TransactionId), "FAILED")
+
+if __name__ == "__main__":
+    unittest.main()
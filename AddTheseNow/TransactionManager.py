@@ -16,11 +16,16 @@ with other components like BackupManager and ValidationEngine.
 
 import os
 import uuid
+import asyncio
 import datetime
-import json
-from typing import Dict, List, Any, Optional, Tuple, Union, Callable
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple, Union, Callable
 
-from Core.DatabaseManager import DatabaseManager
+# DatabaseManager is imported when a manager creates its own, so importing this
+# module does not load sqlite3
+if TYPE_CHECKING:
+    from Core.DatabaseManager import DatabaseManager
 
 # Transaction states
 TRANSACTION_STATES = {
@@ -32,6 +37,52 @@ TRANSACTION_STATES = {
     "ROLLED_BACK": "ROLLED_BACK"
 }
 
+# Number of transaction statuses kept in memory, most recently used first
+STATUS_CACHE_SIZE = 256
+
+# Maximum number of IDs bound into a single "IN (...)" query
+ID_QUERY_CHUNK_SIZE = 500
+
+# Statement recording an operation, shared by single and batched inserts
+_INSERT_OPERATION_SQL = """
+    INSERT INTO operations
+    (id, transaction_id, file_id, operation_type, source_path, destination_path, 
+     timestamp, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+def _EncodeValidationResults(ValidationResult: Dict[str, Any]) -> Optional[str]:
+    """
+    Encode the errors and warnings of a validation result as compact JSON.
+    
+    Args:
+        ValidationResult: Validation results dictionary
+    
+    Returns:
+        Optional[str]: JSON document, or None if there are no errors or warnings
+    """
+    Errors = ValidationResult.get("errors") or []
+    Warnings = ValidationResult.get("warnings") or []
+    if not Errors and not Warnings:
+        return None
+    
+    import json
+    return json.dumps({"errors": Errors, "warnings": Warnings}, separators=(",", ":"))
+
+def _GenerateIds(Count: int) -> List[str]:
+    """
+    Generate random (version 4) UUID strings with a single call to os.urandom.
+    
+    Args:
+        Count: Number of IDs to generate
+    
+    Returns:
+        List[str]: UUID strings in the same format as str(uuid.uuid4())
+    """
+    Random = os.urandom(16 * Count)
+    return [str(uuid.UUID(bytes=Random[Index:Index + 16], version=4)) 
+            for Index in range(0, len(Random), 16)]
+
 class TransactionManager:
     """
     Manages file deployment transactions with rollback capabilities.
@@ -43,17 +94,31 @@ class TransactionManager:
     Attributes:
         DatabaseManager: Instance of DatabaseManager for database operations
         CurrentTransactionId: ID of the active transaction, if any
+        StoreValidationRows: Whether validation errors and warnings are also
+            written to validation_results, one row each
     """
     
-    def __init__(self, DbManager: Optional[DatabaseManager] = None):
+    __slots__ = ("DatabaseManager", "CurrentTransactionId", "StoreValidationRows", "_StatusCache")
+    
+    def __init__(self, DbManager: Optional["DatabaseManager"] = None,
+                 StoreValidationRows: bool = False):
         """
         Initialize the TransactionManager.
         
         Args:
             DbManager: Optional DatabaseManager instance. If None, creates a new instance.
+            StoreValidationRows: Also write each validation error and warning to
+                validation_results, for queries that filter them in SQL. The
+                results are always stored as JSON on the file's row.
         """
-        self.DatabaseManager = DbManager or DatabaseManager()
+        if DbManager is None:
+            from Core.DatabaseManager import DatabaseManager
+            DbManager = DatabaseManager()
+        
+        self.DatabaseManager = DbManager
         self.CurrentTransactionId = None
+        self.StoreValidationRows = StoreValidationRows
+        self._StatusCache: "OrderedDict[str, str]" = OrderedDict()
     
     def CreateTransaction(self, UserId: str, ProjectPath: str, Description: str = None) -> str:
         """
@@ -63,7 +128,7 @@ class TransactionManager:
             UserId: ID of the user creating the transaction
             ProjectPath: Path to the project being deployed
             Description: Optional description of the transaction
-            
+        
         Returns:
             str: ID of the newly created transaction
         """
@@ -83,6 +148,7 @@ class TransactionManager:
             )
             self.DatabaseManager.CommitTransaction()
             self.CurrentTransactionId = TransactionId
+            self._CacheStatus(TransactionId, TRANSACTION_STATES["INITIALIZED"])
             return TransactionId
         except Exception as E:
             self.DatabaseManager.RollbackTransaction()
@@ -92,21 +158,43 @@ class TransactionManager:
         """
         Get the current status of a transaction.
         
+        Statuses set through this manager are cached, so repeated checks on an
+        active transaction do not query the database.
+        
         Args:
             TransactionId: ID of the transaction
-            
+        
         Returns:
             str: Current status of the transaction
         """
-        Result = self.DatabaseManager.ExecuteQueryFetchOne(
+        Status = self._StatusCache.get(TransactionId)
+        if Status is not None:
+            self._StatusCache.move_to_end(TransactionId)
+            return Status
+        
+        Result = self.DatabaseManager.ExecuteReadFetchOne(
             "SELECT status FROM transactions WHERE id = ?",
             (TransactionId,)
         )
         if not Result:
             raise ValueError(f"Transaction {TransactionId} not found")
         
+        self._CacheStatus(TransactionId, Result["status"])
         return Result["status"]
     
+    def _CacheStatus(self, TransactionId: str, Status: str) -> None:
+        """
+        Remember a transaction's status, dropping the least recently used entry when full.
+        
+        Args:
+            TransactionId: ID of the transaction
+            Status: Status of the transaction
+        """
+        self._StatusCache[TransactionId] = Status
+        self._StatusCache.move_to_end(TransactionId)
+        if len(self._StatusCache) > STATUS_CACHE_SIZE:
+            self._StatusCache.popitem(last=False)
+    
     def UpdateTransactionStatus(self, TransactionId: str, Status: str) -> None:
         """
         Update the status of a transaction.
@@ -122,7 +210,7 @@ class TransactionManager:
             "UPDATE transactions SET status = ? WHERE id = ?",
             (Status, TransactionId)
         )
-        self.DatabaseManager.Connection.commit()
+        self._CacheStatus(TransactionId, Status)
     
     def AddFileToTransaction(self, TransactionId: str, SourcePath: str, 
                            DestinationPath: str, Checksum: str = None) -> str:
@@ -133,8 +221,9 @@ class TransactionManager:
             TransactionId: ID of the transaction
             SourcePath: Path to the source file
             DestinationPath: Path where the file will be deployed
-            Checksum: Optional file checksum
-            
+            Checksum: Optional file checksum; if None, the SHA-256 of the
+                source file is calculated
+        
         Returns:
             str: ID of the file entry
         """
@@ -143,6 +232,9 @@ class TransactionManager:
         if Status not in [TRANSACTION_STATES["INITIALIZED"], TRANSACTION_STATES["VALIDATED"]]:
             raise ValueError(f"Cannot add file to transaction in {Status} state")
         
+        if Checksum is None:
+            Checksum = self.DatabaseManager.ComputeChecksum(SourcePath)
+        
         FileId = str(uuid.uuid4())
         OriginalName = os.path.basename(SourcePath)
         
@@ -155,34 +247,76 @@ class TransactionManager:
             (FileId, TransactionId, OriginalName, SourcePath, DestinationPath, 
              "PENDING", Checksum)
         )
-        self.DatabaseManager.Connection.commit()
         
         return FileId
     
+    def AddFilesToTransaction(self, TransactionId: str, 
+                            Files: List[Tuple[str, str, Optional[str]]]) -> List[str]:
+        """
+        Add several files to a transaction in a single database transaction.
+        
+        Args:
+            TransactionId: ID of the transaction
+            Files: List of (source path, destination path, checksum) tuples
+        
+        Returns:
+            List[str]: IDs of the file entries, in the order given
+        """
+        # Check transaction status
+        Status = self.GetTransactionStatus(TransactionId)
+        if Status not in [TRANSACTION_STATES["INITIALIZED"], TRANSACTION_STATES["VALIDATED"]]:
+            raise ValueError(f"Cannot add file to transaction in {Status} state")
+        
+        Rows = [
+            (FileId, TransactionId, os.path.basename(SourcePath), SourcePath, 
+             DestinationPath, "PENDING", Checksum)
+            for FileId, (SourcePath, DestinationPath, Checksum) in zip(_GenerateIds(len(Files)), Files)
+        ]
+        
+        self.DatabaseManager.BeginTransaction()
+        try:
+            self.DatabaseManager.ExecuteMany(
+                """
+                INSERT INTO files
+                (id, transaction_id, original_name, source_path, destination_path, status, checksum)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                Rows
+            )
+            self.DatabaseManager.CommitTransaction()
+        except Exception as E:
+            self.DatabaseManager.RollbackTransaction()
+            raise RuntimeError(f"Failed to add files to transaction: {E}")
+        
+        return [Row[0] for Row in Rows]
+    
     def GetTransactionFiles(self, TransactionId: str) -> List[Dict[str, Any]]:
         """
         Get all files in a transaction.
         
         Args:
             TransactionId: ID of the transaction
-            
+        
         Returns:
             List[Dict[str, Any]]: List of file entries
         """
-        return self.DatabaseManager.ExecuteQueryFetchAll(
+        return self.DatabaseManager.ExecuteReadFetchAll(
             "SELECT * FROM files WHERE transaction_id = ?",
             (TransactionId,)
         )
     
     def ValidateTransaction(self, TransactionId: str, 
-                          ValidationCallback: Callable[[str], Dict[str, Any]]) -> bool:
+                          ValidationCallback: Callable[[str], Dict[str, Any]],
+                          FailFast: bool = False) -> bool:
         """
         Validate all files in a transaction.
         
         Args:
             TransactionId: ID of the transaction
             ValidationCallback: Function to validate a file and return results
-            
+            FailFast: Stop at the first file that fails validation, leaving
+                the remaining files unvalidated
+        
         Returns:
             bool: True if validation passed, False otherwise
         """
@@ -191,35 +325,44 @@ class TransactionManager:
         if Status != TRANSACTION_STATES["INITIALIZED"]:
             raise ValueError(f"Cannot validate transaction in {Status} state")
         
-        Files = self.GetTransactionFiles(TransactionId)
+        Files = self.DatabaseManager.ExecuteReadFetchTuples(
+            "SELECT id, source_path FROM files WHERE transaction_id = ?",
+            (TransactionId,)
+        )
         if not Files:
             raise ValueError(f"Transaction {TransactionId} has no files to validate")
         
         AllValid = True
         
+        # One timestamp covers every result stored by this validation
+        Timestamp = datetime.datetime.now().isoformat()
+        
+        FileUpdates = []
+        
         self.DatabaseManager.BeginTransaction()
         try:
-            for File in Files:
-                FileId = File["id"]
-                SourcePath = File["source_path"]
-                
+            for FileId, SourcePath in Files:
                 # Validate the file
                 ValidationResult = ValidationCallback(SourcePath)
                 ValidationStatus = ValidationResult.get("status", "FAIL")
-                
-                # Update file validation status
-                self.DatabaseManager.ExecuteQuery(
-                    "UPDATE files SET validation_status = ? WHERE id = ?",
-                    (ValidationStatus, FileId)
-                )
+                ValidationJson = _EncodeValidationResults(ValidationResult)
+                FileUpdates.append((ValidationStatus, ValidationJson, FileId))
                 
                 # Store validation results
-                if "errors" in ValidationResult or "warnings" in ValidationResult:
-                    self._StoreValidationResults(FileId, ValidationResult)
+                if ValidationJson and self.StoreValidationRows:
+                    self._StoreValidationResults(FileId, ValidationResult, Timestamp)
                 
                 # Update validation success flag
                 if ValidationStatus == "FAIL":
                     AllValid = False
+                    if FailFast:
+                        break
+            
+            # Update file validation statuses and results
+            self.DatabaseManager.ExecuteMany(
+                "UPDATE files SET validation_status = ?, validation_json = ? WHERE id = ?",
+                FileUpdates
+            )
             
             # Update transaction status
             NewStatus = TRANSACTION_STATES["VALIDATED"] if AllValid else TRANSACTION_STATES["INITIALIZED"]
@@ -232,42 +375,61 @@ class TransactionManager:
             self.UpdateTransactionStatus(TransactionId, TRANSACTION_STATES["INITIALIZED"])
             raise RuntimeError(f"Validation failed: {E}")
     
-    def _StoreValidationResults(self, FileId: str, ValidationResult: Dict[str, Any]) -> None:
+    def GetValidationResults(self, FileId: str) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Store validation results in the database.
+        Get the validation errors and warnings stored for a file.
         
         Args:
             FileId: ID of the file
-            ValidationResult: Validation results dictionary
+        
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: "errors" and "warnings" lists, empty
+                if the file has none or has not been validated
         """
-        Timestamp = datetime.datetime.now().isoformat()
+        Row = self.DatabaseManager.ExecuteReadFetchOne(
+            "SELECT validation_json FROM files WHERE id = ?",
+            (FileId,)
+        )
+        if not Row or not Row["validation_json"]:
+            return {"errors": [], "warnings": []}
         
-        # Process errors
-        for Error in ValidationResult.get("errors", []):
-            self.DatabaseManager.ExecuteQuery(
-                """
-                INSERT INTO validation_results
-                (file_id, rule_id, status, line_number, message, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (FileId, Error.get("rule_id", 0), "FAIL", 
-                 Error.get("line", 0), Error.get("message", ""), Timestamp)
-            )
+        import json
+        return json.loads(Row["validation_json"])
+    
+    def _StoreValidationResults(self, FileId: str, ValidationResult: Dict[str, Any],
+                              Timestamp: Optional[str] = None) -> None:
+        """
+        Store validation results in validation_results, one row per issue.
         
-        # Process warnings
-        for Warning in ValidationResult.get("warnings", []):
-            self.DatabaseManager.ExecuteQuery(
-                """
-                INSERT INTO validation_results
-                (file_id, rule_id, status, line_number, message, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (FileId, Warning.get("rule_id", 0), "WARNING", 
-                 Warning.get("line", 0), Warning.get("message", ""), Timestamp)
-            )
+        Args:
+            FileId: ID of the file
+            ValidationResult: Validation results dictionary
+            Timestamp: Optional timestamp for the results; defaults to now
+        """
+        Timestamp = Timestamp or datetime.datetime.now().isoformat()
+        
+        Rows = [
+            (FileId, Issue.get("rule_id", 0), Status, 
+             Issue.get("line", 0), Issue.get("message", ""), Timestamp)
+            for Status, Key in (("FAIL", "errors"), ("WARNING", "warnings"))
+            for Issue in ValidationResult.get(Key, [])
+        ]
+        if not Rows:
+            return
+        
+        # Store errors and warnings with a single statement
+        self.DatabaseManager.ExecuteMany(
+            """
+            INSERT INTO validation_results
+            (file_id, rule_id, status, line_number, message, timestamp)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            Rows
+        )
     
     def ExecuteTransaction(self, TransactionId: str, BackupId: Optional[str] = None,
-                         ExecuteCallback: Callable[[str, str], bool] = None) -> bool:
+                         ExecuteCallback: Callable[[str, str], bool] = None,
+                         MaxWorkers: int = 1) -> bool:
         """
         Execute a transaction by deploying all validated files.
         
@@ -275,10 +437,174 @@ class TransactionManager:
             TransactionId: ID of the transaction
             BackupId: Optional ID of a backup created before execution
             ExecuteCallback: Function to execute file deployment
-            
+            MaxWorkers: Number of files to deploy concurrently. Values above 1
+                run ExecuteCallback on a thread pool; database writes stay on
+                the calling thread.
+        
         Returns:
             bool: True if execution succeeded, False otherwise
         """
+        Files = self._StartExecution(TransactionId, BackupId)
+        CompletedOperations = []
+        
+        # One timestamp covers every operation recorded by this execution
+        Timestamp = datetime.datetime.now().isoformat()
+        
+        # Files sharing a destination must be deployed in order
+        Destinations = [DestinationPath for _, _, DestinationPath, _ in Files]
+        RunParallel = (ExecuteCallback is not None and MaxWorkers > 1 and
+                       len(Files) > 1 and len(set(Destinations)) == len(Destinations))
+        
+        try:
+            if RunParallel:
+                self._ExecuteFilesParallel(
+                    TransactionId, Files, ExecuteCallback, MaxWorkers, 
+                    CompletedOperations, Timestamp
+                )
+            else:
+                self._ExecuteFilesSerial(
+                    TransactionId, Files, ExecuteCallback, CompletedOperations, Timestamp
+                )
+            
+            # All operations succeeded
+            self.UpdateTransactionStatus(TransactionId, TRANSACTION_STATES["COMPLETED"])
+            return True
+        
+        except Exception as E:
+            self._FailExecution(TransactionId, CompletedOperations)
+            raise RuntimeError(f"Transaction execution failed: {E}")
+    
+    async def ExecuteTransactionAsync(self, TransactionId: str, BackupId: Optional[str] = None,
+                                    ExecuteCallback: Callable[[str, str], bool] = None,
+                                    MaxWorkers: int = 8) -> bool:
+        """
+        Execute a transaction from a running event loop.
+        
+        Deployment callbacks run on a thread pool and are awaited together, so
+        the event loop stays free while files are copied. The first failure
+        cancels the callbacks that have not started. Database writes run on the
+        event loop's thread, as the connection requires.
+        
+        If the awaiting task is cancelled, callbacks that have not started are
+        cancelled, running ones are awaited and recorded, and the transaction
+        is failed and rolled back before the cancellation is passed on.
+        
+        Args:
+            TransactionId: ID of the transaction
+            BackupId: Optional ID of a backup created before execution
+            ExecuteCallback: Function to execute file deployment
+            MaxWorkers: Maximum number of callbacks running at once
+        
+        Returns:
+            bool: True if execution succeeded
+        
+        Raises:
+            RuntimeError: If any file failed to deploy
+            asyncio.CancelledError: If the awaiting task was cancelled
+        """
+        Files = self._StartExecution(TransactionId, BackupId)
+        CompletedOperations = []
+        
+        try:
+            Pending = self._RecordPendingOperations(
+                TransactionId, Files, datetime.datetime.now().isoformat()
+            )
+            
+            Cancelled = False
+            if ExecuteCallback is None or not Pending:
+                Outcomes = [True] * len(Pending)
+            else:
+                # Files sharing a destination must be deployed in order
+                Destinations = [DestinationPath for _, _, DestinationPath, _ in Pending]
+                Workers = max(1, MaxWorkers) if len(set(Destinations)) == len(Destinations) else 1
+                Outcomes, Cancelled = await self._RunCallbacksAsync(Pending, ExecuteCallback, Workers)
+            
+            FailedPaths = self._RecordDeployResults(Pending, Outcomes, CompletedOperations)
+            if Cancelled:
+                raise asyncio.CancelledError()
+            if FailedPaths:
+                raise RuntimeError(f"Failed to deploy file(s): {', '.join(FailedPaths)}")
+            
+            # All operations succeeded
+            self.UpdateTransactionStatus(TransactionId, TRANSACTION_STATES["COMPLETED"])
+            return True
+        
+        except asyncio.CancelledError:
+            self._FailExecution(TransactionId, CompletedOperations)
+            raise
+        
+        except Exception as E:
+            self._FailExecution(TransactionId, CompletedOperations)
+            raise RuntimeError(f"Transaction execution failed: {E}")
+    
+    async def _RunCallbacksAsync(self, Pending: List[Tuple[str, str, str, str]],
+                               ExecuteCallback: Callable[[str, str], bool],
+                               MaxWorkers: int) -> Tuple[List[bool], bool]:
+        """
+        Run deployment callbacks on a thread pool, stopping at the first failure
+        or when the awaiting task is cancelled.
+        
+        Args:
+            Pending: (file ID, source path, destination path, operation ID) to deploy
+            ExecuteCallback: Function to execute file deployment
+            MaxWorkers: Maximum number of callbacks running at once
+        
+        Returns:
+            Tuple[List[bool], bool]: Whether each file was deployed, in the order
+                of Pending, with files cancelled before they started counted as
+                not deployed; and whether the awaiting task was cancelled
+        """
+        Executor = ThreadPoolExecutor(max_workers=MaxWorkers)
+        try:
+            # Keep the executor's own futures, since only they can tell a
+            # callback that has not started from one that is running
+            Futures = [
+                Executor.submit(ExecuteCallback, SourcePath, DestinationPath)
+                for _, SourcePath, DestinationPath, _ in Pending
+            ]
+            Waiting = {asyncio.wrap_future(Future): Future for Future in Futures}
+            
+            Remaining = set(Waiting)
+            Cancelled = False
+            try:
+                while Remaining:
+                    Done, Remaining = await asyncio.wait(
+                        Remaining, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if any(Future.exception() is not None or not Future.result() for Future in Done):
+                        # Cancel what has not started and wait for what has
+                        for Future in Remaining:
+                            Waiting[Future].cancel()
+                        await asyncio.gather(*Remaining, return_exceptions=True)
+                        break
+            except asyncio.CancelledError:
+                # Running callbacks cannot be stopped, so their results are
+                # still needed to record and roll back what they deployed
+                Cancelled = True
+                for Future in Futures:
+                    Future.cancel()
+                await asyncio.gather(*Remaining, return_exceptions=True)
+            
+            return [
+                not Future.cancelled() and Future.exception() is None and bool(Future.result())
+                for Future in Futures
+            ], Cancelled
+        finally:
+            Executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _StartExecution(self, TransactionId: str, 
+                      BackupId: Optional[str]) -> List[Tuple[str, str, str, Optional[str]]]:
+        """
+        Check that a transaction can run, mark it in progress, and get its files.
+        
+        Args:
+            TransactionId: ID of the transaction
+            BackupId: Optional ID of a backup created before execution
+        
+        Returns:
+            List[Tuple[str, str, str, Optional[str]]]: (file ID, source path,
+                destination path, validation status) for each file
+        """
         # Check transaction status
         Status = self.GetTransactionStatus(TransactionId)
         if Status != TRANSACTION_STATES["VALIDATED"]:
@@ -293,70 +619,190 @@ class TransactionManager:
                 "UPDATE transactions SET backup_id = ? WHERE id = ?",
                 (BackupId, TransactionId)
             )
-            self.DatabaseManager.Connection.commit()
         
-        Files = self.GetTransactionFiles(TransactionId)
-        CompletedOperations = []
+        return self.DatabaseManager.ExecuteReadFetchTuples(
+            """
+            SELECT id, source_path, destination_path, validation_status 
+            FROM files WHERE transaction_id = ?
+            """,
+            (TransactionId,)
+        )
+    
+    def _FailExecution(self, TransactionId: str, CompletedOperations: List[str]) -> None:
+        """
+        Roll back the completed operations of a failed execution and mark it failed.
+        
+        Args:
+            TransactionId: ID of the transaction
+            CompletedOperations: IDs of the operations that completed
+        """
+        # Roll back completed operations
+        if CompletedOperations:
+            self._RollbackOperations(CompletedOperations)
+        
+        self.UpdateTransactionStatus(TransactionId, TRANSACTION_STATES["FAILED"])
+    
+    def _ExecuteFilesSerial(self, TransactionId: str, 
+                          Files: List[Tuple[str, str, str, Optional[str]]],
+                          ExecuteCallback: Optional[Callable[[str, str], bool]],
+                          CompletedOperations: List[str], Timestamp: str) -> None:
+        """
+        Deploy files one at a time, stopping at the first failure.
+        
+        Like the parallel path, operations are committed before any file is
+        touched and results are committed together afterwards, so no write
+        lock is held while files are copied. Files after a failure are never
+        attempted and are recorded as failed.
+        
+        Args:
+            TransactionId: ID of the transaction
+            Files: (file ID, source path, destination path, validation status) tuples
+            ExecuteCallback: Function to execute file deployment
+            CompletedOperations: List that receives the IDs of completed operations
+            Timestamp: Timestamp recorded for every operation
+        
+        Raises:
+            RuntimeError: If a file failed to deploy
+        """
+        Pending = self._RecordPendingOperations(TransactionId, Files, Timestamp)
+        Outcomes = [False] * len(Pending)
         
         try:
-            for File in Files:
-                FileId = File["id"]
-                SourcePath = File["source_path"]
-                DestinationPath = File["destination_path"]
-                
-                # Skip files that failed validation
-                if File["validation_status"] == "FAIL":
-                    continue
-                
-                # Record operation
-                OperationId = self._RecordOperation(
-                    TransactionId, FileId, "DEPLOY", SourcePath, DestinationPath
-                )
-                
+            for Index, (_, SourcePath, DestinationPath, _) in enumerate(Pending):
                 # Execute deployment
-                Success = True
-                if ExecuteCallback:
-                    Success = ExecuteCallback(SourcePath, DestinationPath)
-                
-                if Success:
-                    # Update file status
-                    self.DatabaseManager.ExecuteQuery(
-                        "UPDATE files SET status = ? WHERE id = ?",
-                        ("DEPLOYED", FileId)
-                    )
-                    
-                    # Update operation status
-                    self.DatabaseManager.ExecuteQuery(
-                        "UPDATE operations SET status = ? WHERE id = ?",
-                        ("COMPLETED", OperationId)
-                    )
-                    
-                    CompletedOperations.append(OperationId)
-                else:
-                    # Update operation status
-                    self.DatabaseManager.ExecuteQuery(
-                        "UPDATE operations SET status = ? WHERE id = ?",
-                        ("FAILED", OperationId)
-                    )
-                    
+                Outcomes[Index] = True if ExecuteCallback is None else bool(
+                    ExecuteCallback(SourcePath, DestinationPath)
+                )
+                if not Outcomes[Index]:
                     raise RuntimeError(f"Failed to deploy file: {SourcePath}")
-                
-                self.DatabaseManager.Connection.commit()
-            
-            # All operations succeeded
-            self.UpdateTransactionStatus(TransactionId, TRANSACTION_STATES["COMPLETED"])
-            return True
+        finally:
+            # Recorded even when a file fails, since the files deployed before
+            # it have already been written
+            self._RecordDeployResults(Pending, Outcomes, CompletedOperations)
+    
+    def _ExecuteFilesParallel(self, TransactionId: str, 
+                            Files: List[Tuple[str, str, str, Optional[str]]],
+                            ExecuteCallback: Callable[[str, str], bool], MaxWorkers: int,
+                            CompletedOperations: List[str], Timestamp: str) -> None:
+        """
+        Deploy files concurrently on a thread pool.
+        
+        Operations are recorded before any callback runs, and results are written
+        back in file order once every callback has finished, so all database
+        access stays on the calling thread.
+        
+        Args:
+            TransactionId: ID of the transaction
+            Files: (file ID, source path, destination path, validation status) tuples
+            ExecuteCallback: Function to execute file deployment
+            MaxWorkers: Maximum number of concurrent callbacks
+            CompletedOperations: List that receives the IDs of completed operations
+            Timestamp: Timestamp recorded for every operation
+        
+        Raises:
+            RuntimeError: If any file failed to deploy
+        """
+        Pending = self._RecordPendingOperations(TransactionId, Files, Timestamp)
+        
+        with ThreadPoolExecutor(max_workers=MaxWorkers) as Executor:
+            Futures = [
+                Executor.submit(ExecuteCallback, SourcePath, DestinationPath)
+                for _, SourcePath, DestinationPath, _ in Pending
+            ]
+        
+        Outcomes = []
+        for Future in Futures:
+            try:
+                Outcomes.append(bool(Future.result()))
+            except Exception:
+                Outcomes.append(False)
+        
+        FailedPaths = self._RecordDeployResults(Pending, Outcomes, CompletedOperations)
+        if FailedPaths:
+            raise RuntimeError(f"Failed to deploy file(s): {', '.join(FailedPaths)}")
+    
+    def _RecordPendingOperations(self, TransactionId: str, 
+                               Files: List[Tuple[str, str, str, Optional[str]]],
+                               Timestamp: str) -> List[Tuple[str, str, str, str]]:
+        """
+        Record a deploy operation for each file that passed validation.
+        
+        The operations are committed before any file is touched, so an
+        interrupted deployment leaves them recorded as in progress.
+        
+        Args:
+            TransactionId: ID of the transaction
+            Files: (file ID, source path, destination path, validation status) tuples
+            Timestamp: Timestamp recorded for every operation
+        
+        Returns:
+            List[Tuple[str, str, str, str]]: (file ID, source path, destination
+                path, operation ID) for each file to deploy
+        """
+        Pending = []
+        Rows = []
+        for (FileId, SourcePath, DestinationPath, ValidationStatus), OperationId in zip(
+                Files, _GenerateIds(len(Files))):
+            # Skip files that failed validation
+            if ValidationStatus == "FAIL":
+                continue
             
-        except Exception as E:
-            # Roll back completed operations
-            if CompletedOperations:
-                self._RollbackOperations(CompletedOperations)
+            Pending.append((FileId, SourcePath, DestinationPath, OperationId))
+            Rows.append((OperationId, TransactionId, FileId, "DEPLOY", SourcePath, 
+                         DestinationPath, Timestamp, "IN_PROGRESS"))
+        
+        self.DatabaseManager.BeginTransaction()
+        try:
+            self.DatabaseManager.ExecuteMany(_INSERT_OPERATION_SQL, Rows)
+            self.DatabaseManager.CommitTransaction()
+        except Exception:
+            self.DatabaseManager.RollbackTransaction()
+            raise
+        
+        return Pending
+    
+    def _RecordDeployResults(self, Pending: List[Tuple[str, str, str, str]], 
+                           Outcomes: List[bool], CompletedOperations: List[str]) -> List[str]:
+        """
+        Record the outcomes of several deploy operations in one commit.
+        
+        Args:
+            Pending: (file ID, source path, destination path, operation ID) deployed
+            Outcomes: Whether each file was deployed, in the order of Pending
+            CompletedOperations: List that receives the IDs of completed operations
+        
+        Returns:
+            List[str]: Source paths of the files that failed to deploy
+        """
+        DeployedFiles = []
+        OperationStatuses = []
+        FailedPaths = []
+        for (FileId, SourcePath, _, OperationId), Success in zip(Pending, Outcomes):
+            OperationStatuses.append(("COMPLETED" if Success else "FAILED", OperationId))
             
-            self.UpdateTransactionStatus(TransactionId, TRANSACTION_STATES["FAILED"])
-            raise RuntimeError(f"Transaction execution failed: {E}")
+            if Success:
+                DeployedFiles.append(("DEPLOYED", FileId))
+                CompletedOperations.append(OperationId)
+            else:
+                FailedPaths.append(SourcePath)
+        
+        self.DatabaseManager.BeginTransaction()
+        try:
+            self.DatabaseManager.ExecuteMany(
+                "UPDATE files SET status = ? WHERE id = ?", DeployedFiles
+            )
+            self.DatabaseManager.ExecuteMany(
+                "UPDATE operations SET status = ? WHERE id = ?", OperationStatuses
+            )
+        finally:
+            self.DatabaseManager.CommitTransaction()
+        
+        return FailedPaths
     
     def _RecordOperation(self, TransactionId: str, FileId: str, OperationType: str,
-                       SourcePath: str, DestinationPath: str) -> str:
+                       SourcePath: str, DestinationPath: str, 
+                       OperationId: Optional[str] = None, 
+                       Timestamp: Optional[str] = None) -> str:
         """
         Record an operation in the database.
         
@@ -366,20 +812,17 @@ class TransactionManager:
             OperationType: Type of operation
             SourcePath: Source file path
             DestinationPath: Destination file path
-            
+            OperationId: Optional pre-generated ID for the operation
+            Timestamp: Optional timestamp for the operation; defaults to now
+        
         Returns:
             str: ID of the recorded operation
         """
-        OperationId = str(uuid.uuid4())
-        Timestamp = datetime.datetime.now().isoformat()
+        OperationId = OperationId or str(uuid.uuid4())
+        Timestamp = Timestamp or datetime.datetime.now().isoformat()
         
         self.DatabaseManager.ExecuteQuery(
-            """
-            INSERT INTO operations
-            (id, transaction_id, file_id, operation_type, source_path, destination_path, 
-             timestamp, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _INSERT_OPERATION_SQL,
             (OperationId, TransactionId, FileId, OperationType, SourcePath, 
              DestinationPath, Timestamp, "IN_PROGRESS")
         )
@@ -394,59 +837,79 @@ class TransactionManager:
         Args:
             OperationIds: List of operation IDs to roll back
             RollbackCallback: Function to execute operation rollback
-            
+        
         Returns:
             bool: True if rollback succeeded, False otherwise
         """
-        for OperationId in OperationIds:
-            Operation = self.DatabaseManager.ExecuteQueryFetchOne(
-                """
+        Operations = self._GetOperations(OperationIds)
+        RollbackIds = iter(_GenerateIds(len(Operations)))
+        Timestamp = datetime.datetime.now().isoformat()
+        
+        RollbackRows = []
+        RolledBack = []
+        Success = True
+        try:
+            for OperationId in OperationIds:
+                Operation = Operations.get(OperationId)
+                if not Operation:
+                    continue
+                
+                # Record the rollback as failed unless the callback succeeds
+                RollbackRow = [
+                    next(RollbackIds), Operation["transaction_id"], Operation["file_id"], 
+                    "ROLLBACK", None, Operation["destination_path"], Timestamp, "FAILED"
+                ]
+                RollbackRows.append(RollbackRow)
+                
+                # Execute rollback
+                if RollbackCallback:
+                    Success = RollbackCallback(Operation["destination_path"])
+                
+                if not Success:
+                    return False
+                
+                RollbackRow[-1] = "COMPLETED"
+                RolledBack.append(("ROLLED_BACK", OperationId))
+            
+            return True
+        finally:
+            # Record every rollback in one database transaction; it is written
+            # on every exit, since rolled-back files have already been restored
+            self.DatabaseManager.BeginTransaction()
+            try:
+                self.DatabaseManager.ExecuteMany(_INSERT_OPERATION_SQL, RollbackRows)
+                self.DatabaseManager.ExecuteMany(
+                    "UPDATE operations SET status = ? WHERE id = ?", RolledBack
+                )
+            finally:
+                self.DatabaseManager.CommitTransaction()
+    
+    def _GetOperations(self, OperationIds: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several operations, with their file's destination path, by ID.
+        
+        Args:
+            OperationIds: List of operation IDs
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Operations keyed by ID; unknown IDs are left out
+        """
+        Operations = {}
+        for Start in range(0, len(OperationIds), ID_QUERY_CHUNK_SIZE):
+            Chunk = OperationIds[Start:Start + ID_QUERY_CHUNK_SIZE]
+            Placeholders = ", ".join("?" * len(Chunk))
+            for Operation in self.DatabaseManager.ExecuteQueryFetchAll(
+                f"""
                 SELECT o.*, f.destination_path 
                 FROM operations o
                 JOIN files f ON o.file_id = f.id
-                WHERE o.id = ?
+                WHERE o.id IN ({Placeholders})
                 """,
-                (OperationId,)
-            )
-            
-            if not Operation:
-                continue
-            
-            # Record rollback operation
-            RollbackId = self._RecordOperation(
-                Operation["transaction_id"], Operation["file_id"], 
-                "ROLLBACK", None, Operation["destination_path"]
-            )
-            
-            # Execute rollback
-            Success = True
-            if RollbackCallback:
-                Success = RollbackCallback(Operation["destination_path"])
-            
-            if Success:
-                # Update operation status
-                self.DatabaseManager.ExecuteQuery(
-                    "UPDATE operations SET status = ? WHERE id = ?",
-                    ("ROLLED_BACK", OperationId)
-                )
-                
-                # Update rollback operation status
-                self.DatabaseManager.ExecuteQuery(
-                    "UPDATE operations SET status = ? WHERE id = ?",
-                    ("COMPLETED", RollbackId)
-                )
-            else:
-                # Update rollback operation status
-                self.DatabaseManager.ExecuteQuery(
-                    "UPDATE operations SET status = ? WHERE id = ?",
-                    ("FAILED", RollbackId)
-                )
-                
-                return False
-            
-            self.DatabaseManager.Connection.commit()
+                tuple(Chunk)
+            ):
+                Operations[Operation["id"]] = Operation
         
-        return True
+        return Operations
     
     def RollbackTransaction(self, TransactionId: str, 
                           RollbackCallback: Callable[[str], bool] = None) -> bool:
@@ -456,12 +919,12 @@ class TransactionManager:
         Args:
             TransactionId: ID of the transaction
             RollbackCallback: Function to execute operation rollback
-            
+        
         Returns:
             bool: True if rollback succeeded, False otherwise
         """
         # Get completed operations
-        Operations = self.DatabaseManager.ExecuteQueryFetchAll(
+        Operations = self.DatabaseManager.ExecuteReadFetchAll(
             """
             SELECT id FROM operations 
             WHERE transaction_id = ? AND status = ? AND operation_type = ?
@@ -488,10 +951,20 @@ class TransactionManager:
             TransactionId = self.CurrentTransactionId
         
         if TransactionId:
-            # Check if transaction is still active
-            Status = self.GetTransactionStatus(TransactionId)
+            # Check if transaction is still active; only an in-progress
+            # transaction needs its status changed
+            Status = self._StatusCache.get(TransactionId)
             if Status == TRANSACTION_STATES["IN_PROGRESS"]:
                 self.UpdateTransactionStatus(TransactionId, TRANSACTION_STATES["FAILED"])
+            elif Status is None:
+                # Unknown status: let the database make the same check
+                self.DatabaseManager.ExecuteQuery(
+                    "UPDATE transactions SET status = ? WHERE id = ? AND status = ?",
+                    (TRANSACTION_STATES["FAILED"], TransactionId, TRANSACTION_STATES["IN_PROGRESS"])
+                )
+            
+            # A closed transaction is no longer checked on the hot path
+            self._StatusCache.pop(TransactionId, None)
             
             if TransactionId == self.CurrentTransactionId:
                 self.CurrentTransactionId = None
@@ -1,26 +1,58 @@
 import os
+import sys
 import shutil
 import datetime
 import re
 import logging
 import sqlite3
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 DATABASE_PATH = "/home/herb/Desktop/AIDEV-Hub/Databases/Project/ChangeArchive.db"
 CODEBASE_SUMMARY_SCRIPT = "Scripts/CodebaseSummary.sh"
 LOG_FILE_NAME = "process_add_these_now_{}.txt".format(datetime.datetime.now().strftime("%Y%m%d%H%M%S"))
+LOG_BATCH_SIZE = 128  # Log records buffered by DatabaseHandler before they are written
+PATH_RE = re.compile(r"Path:\s*(.+)")  # Destination directory in a file's "Path:" header
+HEADER_BYTES = 512  # Bytes read from the start of each file to find its header
+HEADER_LINES = 5  # Lines of the header searched for "Path:"
+LINK_FILES = False  # Hard-link files into place when possible instead of copying them
+MAX_WORKERS = 8  # Files read, archived or copied at once
+LOG_INSERT_SQL = "INSERT INTO logs (level, message, program, directory, log_date) VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)"
 
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(levelname)s - %(message)s',
                     handlers=[logging.FileHandler(LOG_FILE_NAME), logging.StreamHandler()])
 
+_CONN = None  # Connection to the log database shared by the whole process
+
+def get_conn():
+    """
+    Returns the process-wide connection to the log database, opening it on first use.
+    The connection is in autocommit mode; statements that belong together are wrapped in BEGIN/COMMIT.
+    """
+    global _CONN
+    if _CONN is None:
+        _CONN = sqlite3.connect(DATABASE_PATH, check_same_thread=False, isolation_level=None)
+        # The WAL journal mode is stored in the database file; the others apply to this connection
+        _CONN.execute("PRAGMA journal_mode=WAL")
+        _CONN.execute("PRAGMA synchronous=NORMAL")
+        _CONN.execute("PRAGMA temp_store=MEMORY")
+        _CONN.execute("PRAGMA cache_size=-65536")
+    return _CONN
+
+def close_conn():
+    """Closes the shared database connection, if it is open."""
+    global _CONN
+    if _CONN is not None:
+        _CONN.close()
+        _CONN = None
+
 def create_database():
     """Creates the SQLite database and the log table if they don't exist."""
-    conn = None
     try:
         os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
-        conn = sqlite3.connect(DATABASE_PATH)
+        conn = get_conn()
         cursor = conn.cursor()
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS logs (
@@ -30,12 +62,9 @@ def create_database():
                 message TEXT,
                 program TEXT,
                 directory TEXT,
-                log_date DATETIME
+                log_date DATETIME DEFAULT CURRENT_TIMESTAMP
             )
         """)
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_program ON logs (program)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_directory ON logs (directory)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_log_date ON logs (log_date)")
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS summary (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -47,17 +76,25 @@ def create_database():
                 database_status TEXT
             )
         """)
-        conn.commit()
         logging.info("Database and table created successfully.")
     except sqlite3.Error as e:
         logging.exception(f"Database error: {e}")
-    finally:
-        if conn:
-            conn.close()
+
+def finalize_indexes():
+    """
+    Creates the log table's indexes if they don't exist. This runs after the file loop rather
+    than with the table, so the inserts of a new database's first run don't maintain them.
+    """
+    try:
+        conn = get_conn()
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_program ON logs (program)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_directory ON logs (directory)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_logs_log_date ON logs (log_date)")
+    except sqlite3.Error as e:
+        logging.exception(f"Database error: {e}")
 
 def check_and_create_database():
     """Checks if the database exists, and creates it if it doesn't."""
-    conn = None
     try:
         if not os.path.exists(DATABASE_PATH):
             logging.info("Database not found. Creating database...")
@@ -66,9 +103,6 @@ def check_and_create_database():
             logging.info("Database found.")
     except sqlite3.Error as e:
         logging.error(f"Database error: {e}")
-    finally:
-        if conn:
-            conn.close()
 
 class DatabaseHandler(logging.Handler):
     """
@@ -79,24 +113,57 @@ class DatabaseHandler(logging.Handler):
         check_and_create_database()
         self.current_program = None
         self.current_directory = None
+        self.buffer = []
+
+        # Bound once, since emit runs for every log record
+        self._append = self.buffer.append
 
     def emit(self, record):
         """
-        Emits a log record to the SQLite database.
+        Buffers a log record, writing the buffer to the SQLite database once it is full.
+        """
+        self._append((record.levelname, record.getMessage(), self.current_program, self.current_directory))
+        if len(self.buffer) >= LOG_BATCH_SIZE:
+            self.write_buffer()
+
+    def write_buffer(self):
+        """
+        Writes the buffered log records to the SQLite database in one transaction.
+        If a transaction is already open, the records become part of it instead.
         """
+        if not self.buffer:
+            return
+        # Take the records first, so nothing written while they are inserted can grow this batch
+        records = self.buffer[:]
+        self.buffer.clear()
+        conn = get_conn()
+        own_transaction = not conn.in_transaction
         try:
-            conn = sqlite3.connect(DATABASE_PATH)
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO logs (level, message, program, directory, log_date)
-                VALUES (?, ?, ?, ?, ?)
-            """, (record.levelname, record.getMessage(), self.current_program, self.current_directory, datetime.datetime.now()))
-            conn.commit()
+            if own_transaction:
+                conn.execute("BEGIN")
+            conn.executemany(LOG_INSERT_SQL, records)
+            if own_transaction:
+                conn.execute("COMMIT")
         except sqlite3.Error as e:
-            logging.exception(f"Database error: {e}")
-        finally:
-            if conn:
-                conn.close()
+            if own_transaction and conn.in_transaction:
+                conn.rollback()
+            # Not logged: this handler is on the root logger, so that would come straight back here
+            print(f"Database error: {e}", file=sys.stderr)
+
+    def flush(self):
+        """
+        Writes any buffered log records to the SQLite database.
+        """
+        with self.lock:
+            self.write_buffer()
+
+    def close(self):
+        """
+        Writes any buffered log records, then closes the handler and the database connection.
+        """
+        self.flush()
+        close_conn()
+        super().close()
 
 def run_codebase_summary():
     """Runs the CodebaseSummary.sh script."""
@@ -106,6 +173,43 @@ def run_codebase_summary():
     except subprocess.CalledProcessError as e:
         logging.error("Error running codebase summary script")
 
+def copy_file(source_path, dest_path):
+    """
+    Copies a file with its metadata. When LINK_FILES is set, the file is hard-linked instead
+    if both paths are on the same filesystem, which writes no data at all.
+    Raises FileExistsError rather than overwriting a file already at dest_path.
+    """
+    if LINK_FILES:
+        try:
+            os.link(source_path, dest_path)
+            return
+        except FileExistsError:
+            raise
+        except OSError:
+            pass
+    # Check and create the destination in one atomic call instead of an exists() check first
+    os.close(os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+    try:
+        # copy2 copies the data in the kernel (copy_file_range/sendfile) where available
+        shutil.copy2(source_path, dest_path)
+    except BaseException:
+        os.remove(dest_path)
+        raise
+
+def read_header_path(source_path):
+    """
+    Returns the destination directory named in a file's "Path:" header, or None if it has none.
+    """
+    with open(source_path, 'rb') as file:
+        head = file.read(HEADER_BYTES)
+    # Only decode and search headers that can contain the marker
+    if b"Path:" not in head:
+        return None
+    # Split off just the header lines (maxsplit stops after them) and join them in one pass
+    header = b"\n".join(head.split(b"\n", HEADER_LINES)[:HEADER_LINES]).decode('utf-8', errors='replace')
+    match = PATH_RE.search(header)
+    return match.group(1).strip() if match else None
+
 def process_files(source_dir):
     """
     Reads all files in the source directory, extracts the 'Path:' from the header of Python files,
@@ -121,88 +225,138 @@ def process_files(source_dir):
     # Check and create database
     check_and_create_database()
 
-    # Configure logging to write to the database and file
-    logger = logging.getLogger(__name__)
-    logger.setLevel(logging.INFO)
-
-    # Create handlers
-    fh = logging.FileHandler(LOG_FILE_NAME)
-    sh = logging.StreamHandler()
+    # Add database logging to the root logger, which already writes to the log file and
+    # console through basicConfig and receives every logging.* call in this script
+    root_logger = logging.getLogger()
+    db_handler = next((h for h in root_logger.handlers if isinstance(h, DatabaseHandler)), None)
+    if db_handler is None:
+        db_handler = DatabaseHandler()
+        root_logger.addHandler(db_handler)
 
-    # Set level and formatter
-    fh.setLevel(logging.INFO)
-    sh.setLevel(logging.INFO)
-    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-    fh.setFormatter(formatter)
-    sh.setFormatter(formatter)
+    # Write this run's log records and summary in a single transaction
+    conn = get_conn()
+    conn.execute("BEGIN")
 
-    # Add handlers to logger
-    logger.addHandler(fh)
-    logger.addHandler(sh)
-
-    db_handler = DatabaseHandler()
-    logger.addHandler(db_handler)
+    archive_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(source_dir))), "..Exclude", "ProjectArchive")
 
+    # File I/O runs on a thread pool; results are logged and counted here, in directory order,
+    # so the database handler's current_program matches each record
     try:
-        for filename in os.listdir(source_dir):
-            source_path = os.path.join(source_dir, filename)
-            db_handler.current_program = filename
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Find each Python file's destination from its header
+            # scandir reports each entry's type from the directory listing, without a stat per file
+            with os.scandir(source_dir) as it:
+                candidates = [(entry.name, entry.path) for entry in it if entry.is_file() and entry.name.endswith(".py")]
             db_handler.current_directory = source_dir
 
-            # Check if it's a file
-            if os.path.isfile(source_path):
-                # Check if it's a Python file
-                if filename.endswith(".py"):
-                    try:
-                        with open(source_path, 'r') as file:
-                            header = ""
-                            for i in range(5):  # Read the first 5 lines
-                                header += file.readline()
-                            match = re.search(r"Path:\s*(.+)", header)
-
-                            if match:
-                                num_files_with_path += 1
-                                dest_dir = match.group(1).strip()
-                                dest_filename = filename
-                                dest_path = os.path.join(dest_dir, dest_filename)
-
-                                # Check if the destination directory exists, create if it doesn't
-                                os.makedirs(dest_dir, exist_ok=True)
-
-                                # Check if the file already exists in the destination directory
-                                if os.path.exists(dest_path):
-                                    # Run CodebaseSummary.sh before archiving
-                                    run_codebase_summary()
-
-                                    # Rename the existing file with a timestamp
-                                    timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
-                                    archive_filename = f"{os.path.splitext(dest_filename)[0]}_{timestamp}{os.path.splitext(dest_filename)[1]}"
-                                archive_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(source_dir))), "..Exclude", "ProjectArchive")
-                                os.makedirs(archive_dir, exist_ok=True)
-                                archive_path = os.path.join(archive_dir, archive_filename)
-                                shutil.move(dest_path, archive_path)
-                                logging.info(f"File already exists: {dest_path}. Moved to {archive_path}")
-                                num_files_archived += 1
-
-                            # Copy the file to the destination directory
-                            shutil.copy2(source_path, dest_path)  # Use copy2 to preserve metadata
-                            logging.info(f"Copied {source_path} to {dest_path}")
-                            num_files_copied += 1
-                        else:
-                            logging.warning(f"No 'Path:' found in header of {source_path}")
-
-                        num_files_processed += 1
-
-                    except Exception as e:
+            futures = [executor.submit(read_header_path, source_path) for _, source_path in candidates]
+            todo = []
+            for (filename, source_path), future in zip(candidates, futures):
+                db_handler.current_program = filename
+                if future.exception() is not None:
+                    logging.error(f"Error processing {source_path}", exc_info=future.exception())
+                elif future.result():
+                    num_files_with_path += 1
+                    todo.append((filename, source_path, future.result()))
+                else:
+                    logging.warning(f"No 'Path:' found in header of {source_path}")
+                    num_files_processed += 1
+
+            # Create each destination directory once and list what it already contains
+            existing = {}
+            for dest_dir in {dest_dir for _, _, dest_dir in todo}:
+                try:
+                    os.makedirs(dest_dir, exist_ok=True)
+                    with os.scandir(dest_dir) as it:
+                        existing[dest_dir] = {dest_entry.name for dest_entry in it}
+                except Exception as e:
+                    logging.exception(f"Error preparing destination directory {dest_dir}")
+
+            copies = []  # (filename, source_path, dest_path)
+            archives = []  # (filename, source_path, dest_path, archive_path)
+            for filename, source_path, dest_dir in todo:
+                dest_path = os.path.join(dest_dir, filename)
+                if dest_dir not in existing:
+                    # The directory could not be created; that error has already been logged
+                    db_handler.current_program = filename
+                    logging.error(f"Error processing {source_path}: {dest_dir} is not available")
+                elif filename in existing[dest_dir]:
+                    # Rename the existing file with a timestamp
+                    timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+                    stem, ext = os.path.splitext(filename)
+                    archives.append((filename, source_path, dest_path, os.path.join(archive_dir, f"{stem}_{timestamp}{ext}")))
+                else:
+                    copies.append((filename, source_path, dest_path))
+
+            # Archive the files being replaced
+            if archives:
+                try:
+                    # Run CodebaseSummary.sh once, before any file is archived
+                    run_codebase_summary()
+                    os.makedirs(archive_dir, exist_ok=True)
+                except OSError:
+                    # Only the files being replaced fail; new files are still copied
+                    for filename, source_path, _, _ in archives:
+                        db_handler.current_program = filename
                         logging.exception(f"Error processing {source_path}")
+                    archives = []
+            archive_ready = bool(archives)
+
+            futures = [executor.submit(shutil.move, dest_path, archive_path) for _, _, dest_path, archive_path in archives]
+            for (filename, source_path, dest_path, archive_path), future in zip(archives, futures):
+                db_handler.current_program = filename
+                if future.exception() is not None:
+                    logging.error(f"Error processing {source_path}", exc_info=future.exception())
+                else:
+                    logging.info(f"File already exists: {dest_path}. Moved to {archive_path}")
+                    num_files_archived += 1
+                    copies.append((filename, source_path, dest_path))
+
+            # Copy the files to their destination directories
+            futures = [executor.submit(copy_file, source_path, dest_path) for _, source_path, dest_path in copies]
+            raced = []
+            for (filename, source_path, dest_path), future in zip(copies, futures):
+                db_handler.current_program = filename
+                if isinstance(future.exception(), FileExistsError):
+                    # The file appeared after its directory was listed
+                    raced.append((filename, source_path, dest_path))
+                elif future.exception() is not None:
+                    logging.error(f"Error processing {source_path}", exc_info=future.exception())
+                else:
+                    logging.info(f"Copied {source_path} to {dest_path}")
+                    num_files_copied += 1
+                    num_files_processed += 1
+
+            # Archive and copy those files one at a time, like any other existing file
+            for filename, source_path, dest_path in raced:
+                db_handler.current_program = filename
+                try:
+                    if not archive_ready:
+                        run_codebase_summary()
+                        os.makedirs(archive_dir, exist_ok=True)
+                        archive_ready = True
+                    timestamp = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+                    stem, ext = os.path.splitext(filename)
+                    archive_path = os.path.join(archive_dir, f"{stem}_{timestamp}{ext}")
+                    shutil.move(dest_path, archive_path)
+                    logging.info(f"File already exists: {dest_path}. Moved to {archive_path}")
+                    num_files_archived += 1
+                    copy_file(source_path, dest_path)
+                    logging.info(f"Copied {source_path} to {dest_path}")
+                    num_files_copied += 1
+                    num_files_processed += 1
+                except Exception as e:
+                    logging.exception(f"Error processing {source_path}")
 
     except Exception as e:
         logging.exception(f"General error in process_files: {e}")
         db_status = "Error"
 
+    # Write the buffered log records before counting them
+    db_handler.flush()
+
     # Test the database
     try:
-        conn = sqlite3.connect(DATABASE_PATH)
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM logs")
         count = cursor.fetchone()[0]
@@ -220,12 +374,8 @@ def process_files(source_dir):
                 INSERT INTO summary (files_processed, files_with_path, files_archived, files_copied, database_status)
                 VALUES (?, ?, ?, ?, ?)
             """, (num_files_processed, num_files_with_path, num_files_archived, num_files_copied, db_status))
-            conn.commit()
         except sqlite3.Error as e:
             logging.exception(f"Database error during test: {e}")
-        finally:
-            if conn:
-                conn.close()
 
     except sqlite3.Error as e:
         logging.exception(f"Database connection error: {e}")
@@ -238,6 +388,13 @@ def process_files(source_dir):
     logging.info(f"Files copied: {num_files_copied}")
     logging.info(f"Database status: {db_status}")
 
+    # Write the summary's log records too, then commit them with the rest of the run
+    db_handler.flush()
+    if conn.in_transaction:
+        conn.commit()
+
+    finalize_indexes()
+
 if __name__ == "__main__":
     # Ensure database exists before running process_files
     source_directory = "AddTheseNow"
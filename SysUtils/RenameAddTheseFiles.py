@@ -8,123 +8,206 @@
 import os
 import re
 import shutil
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 
-def RenameFiles(SourceDir, DestDir):
+# Number of leading lines searched for a Python file's "# File:" header
+PYTHON_HEADER_LINES = 20
+
+# Default number of files read or copied at once
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# First Markdown heading, used as the report name
+_MD_HEADER_RE = re.compile(r'#\s+(.*)')
+
+# Name in a Python file's "# File:" header line
+_PY_FILE_RE = re.compile(r'# File:\s*(.*)\.py')
+
+# Characters that are not allowed in filenames
+_SANITIZE_RE = re.compile(r'[\\/*?"<>|:]')
+
+def RenameFiles(SourceDir, DestDir, PreserveMetadata=True, MaxWorkers=DEFAULT_MAX_WORKERS):
     """
     Reads files from source directory, renames them based on content,
     and saves them to destination directory.
     
+    Files are read and copied on a thread pool. New names are assigned one
+    file at a time in directory order, so duplicates are numbered the same
+    way on every run.
+    
     Args:
         SourceDir (str): Source directory containing files to rename
         DestDir (str): Destination directory for renamed files
+        PreserveMetadata (bool): Copy timestamps and permission bits along
+            with the contents
+        MaxWorkers (int): Maximum number of files read or copied at once
     """
     if not os.path.exists(DestDir):
         os.makedirs(DestDir)
 
-    for Filename in os.listdir(SourceDir):
-        SourcePath = os.path.join(SourceDir, Filename)
-
-        if not os.path.isfile(SourcePath):
-            continue
-
-        try:
-            with open(SourcePath, 'r', encoding='utf-8') as File:
-                Content = File.read()
-
-            # Determine file type and extract filename
-            if Filename.endswith('.md'):  # Markdown file
-                # Extract report header (first heading)
-                NewFilename = ExtractMarkdownFilename(SourcePath, Filename)
-            elif Filename.endswith('.py'):  # Python file
-                # Extract filename from "# File:" line
-                NewFilename = ExtractPythonFilename(SourcePath, Filename)
-            else:
-                # If not Markdown or Python, keep the original filename
-                NewFilename = Filename
-
-            # Handle duplicates
-            DestPath = os.path.join(DestDir, NewFilename)
-            if os.path.exists(DestPath):
-                DestPath = HandleDuplicateFilename(DestDir, NewFilename)
-                NewFilename = os.path.basename(DestPath)
-
-            # Save the file
-            shutil.copy2(SourcePath, DestPath)  # Copy with metadata
+    # Names already taken in the destination, kept current as names are assigned
+    Existing = set(os.listdir(DestDir))
+
+    Filenames = [
+        Filename for Filename in os.listdir(SourceDir)
+        if os.path.isfile(os.path.join(SourceDir, Filename))
+    ]
+
+    with ThreadPoolExecutor(max_workers=max(1, MaxWorkers)) as Executor:
+        # Read each file and work out its new name
+        Names = list(Executor.map(
+            lambda Filename: _CallSafely(GetNewFilename, SourceDir, Filename), Filenames
+        ))
+
+        # Handle duplicates
+        Copies = []
+        for Filename, (NewFilename, Error) in zip(Filenames, Names):
+            if Error is None:
+                if NewFilename in Existing:
+                    NewFilename = HandleDuplicateFilename(Existing, NewFilename)
+                Existing.add(NewFilename)
+            Copies.append((Filename, NewFilename, Error))
+
+        # Save the files
+        Futures = [
+            None if Error else Executor.submit(
+                _CallSafely, CopyRenamedFile, os.path.join(SourceDir, Filename),
+                os.path.join(DestDir, NewFilename), PreserveMetadata
+            )
+            for Filename, NewFilename, Error in Copies
+        ]
+
+    for (Filename, NewFilename, Error), Future in zip(Copies, Futures):
+        if Future is not None:
+            Error = Future.result()[1]
+
+        if Error is None:
             print(f"Renamed '{Filename}' to '{NewFilename}' and saved to '{DestDir}'")
+        else:
+            print(f"Error processing '{Filename}': {Error}")
+
+def _CallSafely(Function, *Args):
+    """
+    Call a function, capturing any exception instead of raising it.
+    
+    Args:
+        Function (callable): Function to call
+        *Args: Arguments for the function
+        
+    Returns:
+        tuple: (result, None) on success, or (None, exception) on failure
+    """
+    try:
+        return Function(*Args), None
+    except Exception as e:
+        return None, e
+
+def GetNewFilename(SourceDir, Filename):
+    """
+    Work out the new name for a file from its content.
+    
+    Args:
+        SourceDir (str): Source directory containing the file
+        Filename (str): Name of the file in SourceDir
+        
+    Returns:
+        str: New filename, before duplicates are handled
+    """
+    SourcePath = os.path.join(SourceDir, Filename)
 
-        except Exception as e:
-            print(f"Error processing '{Filename}': {e}")
+    # Determine file type and extract filename
+    if Filename.endswith('.md'):  # Markdown file
+        # Extract report header (first heading)
+        with open(SourcePath, 'r', encoding='utf-8') as File:
+            Content = File.read()
+        return ExtractMarkdownFilename(Content, Filename)
+    elif Filename.endswith('.py'):  # Python file
+        # Extract filename from "# File:" line, which is in the header
+        with open(SourcePath, 'r', encoding='utf-8') as File:
+            Content = ''.join(islice(File, PYTHON_HEADER_LINES))
+        return ExtractPythonFilename(Content, Filename)
 
-def ExtractMarkdownFilename(SourcePath, DefaultFilename):
+    # If not Markdown or Python, keep the original filename
+    return Filename
+
+def CopyRenamedFile(SourcePath, DestPath, PreserveMetadata=True):
+    """
+    Copy a file to its renamed destination.
+    
+    Args:
+        SourcePath (str): Path to the source file
+        DestPath (str): Path to save the file to
+        PreserveMetadata (bool): Copy timestamps and permission bits along
+            with the contents
+    """
+    # copyfile uses the kernel's zero-copy path where available
+    shutil.copyfile(SourcePath, DestPath)
+    if PreserveMetadata:
+        shutil.copystat(SourcePath, DestPath)
+
+def ExtractMarkdownFilename(Content, DefaultFilename):
     """
     Extract a filename from a Markdown file based on its first heading.
     
     Args:
-        SourcePath (str): Path to the Markdown file
+        Content (str): Text of the Markdown file
         DefaultFilename (str): Default filename to use if extraction fails
         
     Returns:
         str: Extracted filename with .md extension
     """
-    with open(SourcePath, 'r', encoding='utf-8') as File:
-        Content = File.read()
-    
-    Match = re.search(r'#\s+(.*)', Content)
+    Match = _MD_HEADER_RE.search(Content)
     if Match:
         NewFilename = Match.group(1).strip()
     else:
         NewFilename = DefaultFilename  # Use original filename if no header found
     
-    NewFilename = re.sub(r'[\\\\/*?"<>|:]', '-', NewFilename)
+    NewFilename = _SANITIZE_RE.sub('-', NewFilename)
     if not NewFilename.endswith('.md'):
         NewFilename += '.md'
     
     return NewFilename
 
-def ExtractPythonFilename(SourcePath, DefaultFilename):
+def ExtractPythonFilename(Content, DefaultFilename):
     """
     Extract a filename from a Python file based on its "# File:" comment.
     
     Args:
-        SourcePath (str): Path to the Python file
+        Content (str): Text of the Python file, or at least its header
         DefaultFilename (str): Default filename to use if extraction fails
         
     Returns:
         str: Extracted filename with .py extension
     """
-    with open(SourcePath, 'r', encoding='utf-8') as File:
-        Content = File.read()
-    
-    Match = re.search(r'# File:\s*(.*).py', Content)
+    Match = _PY_FILE_RE.search(Content)
     if Match:
         NewFilename = Match.group(1).strip()
         NewFilename = NewFilename.replace('File-', '').strip()
-        NewFilename = re.sub(r'[\\\\/*?"<>|:]', '-', NewFilename) + '.py'
+        NewFilename = _SANITIZE_RE.sub('-', NewFilename) + '.py'
     else:
         NewFilename = DefaultFilename  # Use original filename if no filename line found
     
     return NewFilename
 
-def HandleDuplicateFilename(DestDir, Filename):
+def HandleDuplicateFilename(Existing, Filename):
     """
     Handle duplicate filenames by appending an incremental number.
     
     Args:
-        DestDir (str): Destination directory
+        Existing (set): Filenames already present in the destination directory
         Filename (str): Original filename
         
     Returns:
-        str: Path to a non-conflicting filename
+        str: A filename not in Existing
     """
     BaseName, Ext = os.path.splitext(Filename)
     Counter = 1
     
     while True:
         NewFilename = f"{BaseName}_{Counter}{Ext}"
-        DestPath = os.path.join(DestDir, NewFilename)
         
-        if not os.path.exists(DestPath):
-            return DestPath
+        if NewFilename not in Existing:
+            return NewFilename
         
         Counter += 1
 